@@ -0,0 +1,160 @@
+import os
+import json
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+from asset_pack import normaliser
+
+# Manifeste de construction des assets :
+#   sortie (chemin normalisé) -> genre, ligne de contenu d'origine, empreinte des entrées,
+#   empreinte et signature (taille, mtime) du fichier produit.
+# Une sortie n'est reconstruite que si ses entrées ont changé ou si le fichier
+# a disparu / été modifié à la main.
+VERSION = 1
+CHEMIN_DEFAUT = "assets_manifest.json"
+
+
+def empreinte_entrees(entrees: Dict) -> str:
+    """Empreinte stable des paramètres d'une construction (contenu, voix, réglages...)."""
+    brut = json.dumps(entrees, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(brut.encode("utf-8")).hexdigest()
+
+
+def empreinte_fichier(chemin: str) -> str:
+    h = hashlib.sha256()
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+def _signature(chemin: str) -> List[int]:
+    st = os.stat(chemin)
+    return [st.st_size, st.st_mtime_ns]
+
+
+class AssetManifest:
+    """Lecture / écriture du manifeste et décisions de reconstruction."""
+
+    def __init__(self, chemin: str = CHEMIN_DEFAUT) -> None:
+        self.chemin = chemin
+        # Les clés sont relatives au dossier du manifeste, quel que soit le dossier courant
+        self.racine = os.path.dirname(os.path.abspath(chemin))
+        self.entrees: Dict[str, Dict] = {}
+        try:
+            with open(chemin, "r", encoding="utf-8") as f:
+                donnees = json.load(f)
+            if donnees.get("version") == VERSION:
+                self.entrees = donnees.get("sorties", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Manifeste illisible ({chemin}), tout sera reconstruit : {e}")
+
+    def _cle(self, chemin: str) -> str:
+        return normaliser(os.path.relpath(os.path.abspath(chemin), self.racine))
+
+    def a_jour(self, sortie: str, entrees: Dict) -> bool:
+        """True si `sortie` existe, provient des mêmes entrées et n'a pas été modifiée depuis."""
+        entree = self.entrees.get(self._cle(sortie))
+        if not entree or entree["entrees"] != empreinte_entrees(entrees):
+            return False
+        return self._fichier_intact(sortie, entree)
+
+    def _fichier_intact(self, sortie: str, entree: Dict) -> bool:
+        if not os.path.exists(sortie):
+            return False
+        signature = _signature(sortie)
+        if signature == entree["signature"]:
+            return True
+        # Date changée (copie, checkout git...) : seul le contenu fait foi
+        if empreinte_fichier(sortie) != entree["sortie"]:
+            return False
+        entree["signature"] = signature
+        return True
+
+    def enregistrer(self, sortie: str, genre: str, entrees: Dict, contenu: Optional[Dict] = None) -> None:
+        """
+        Note une sortie fraîchement construite.
+
+        Args:
+            sortie: Fichier produit.
+            genre: 'audio', 'image', 'backup', 'paquet'...
+            entrees: Tout ce qui détermine le fichier produit.
+            contenu: Ligne de educational_content d'origine (id, type, content, word).
+        """
+        self.entrees[self._cle(sortie)] = {
+            "genre": genre,
+            "contenu": contenu,
+            "entrees": empreinte_entrees(entrees),
+            "sortie": empreinte_fichier(sortie),
+            "signature": _signature(sortie),
+        }
+
+    def oublier(self, sortie: str) -> None:
+        self.entrees.pop(self._cle(sortie), None)
+
+    def sauver(self) -> None:
+        """Écrit le manifeste de façon atomique."""
+        donnees = {"version": VERSION, "sorties": dict(sorted(self.entrees.items()))}
+        with open(self.chemin + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(donnees, f, indent=1, ensure_ascii=False)
+        os.replace(self.chemin + ".tmp", self.chemin)
+
+    def verifier(self, lignes: Iterable[Dict], dossier: str = "assets",
+                 extras: Iterable[str] = ()) -> Dict[str, List[str]]:
+        """
+        Parcourt `dossier` une seule fois et classe les problèmes.
+
+        Args:
+            lignes: Contenu actuel (lignes de educational_content).
+            dossier: Racine des assets.
+            extras: Fichiers utilisés par le jeu hors de la table (effets sonores...).
+
+        Returns:
+            {'perimes': sorties dont la ligne d'origine a changé, disparu ou dont le fichier
+             a été modifié, 'manquants': sorties du manifeste absentes du disque,
+             'orphelins': fichiers ni construits ni référencés par le contenu}
+        """
+        actuelles = {}
+        references = {self._cle(chemin) for chemin in extras}
+        for ligne in lignes:
+            actuelles[(ligne.get("type"), str(ligne.get("content")))] = ligne
+            # Même résolution que l'AssetManager : chemin tel quel ou nom de fichier sous assets/
+            for colonne, sous_dossier in (("image_url", "images"), ("sound_url", "sounds")):
+                if ligne.get(colonne):
+                    references.add(self._cle(ligne[colonne]))
+                    references.add(self._cle(os.path.join(dossier, sous_dossier, os.path.basename(ligne[colonne]))))
+
+        rapport: Dict[str, List[str]] = {"perimes": [], "manquants": [], "orphelins": []}
+        presents = set()
+        for racine, _, noms in os.walk(dossier):
+            for nom in noms:
+                if nom.startswith(".") or nom.endswith(".tmp"):
+                    continue
+                chemin = os.path.join(racine, nom)
+                cle = self._cle(chemin)
+                presents.add(cle)
+                entree = self.entrees.get(cle)
+                if entree is None:
+                    if cle not in references:
+                        rapport["orphelins"].append(cle)
+                elif not self._fichier_intact(chemin, entree) or self._origine_changee(entree, actuelles):
+                    rapport["perimes"].append(cle)
+
+        prefixe = self._cle(dossier) + "/"
+        rapport["manquants"] = sorted(c for c in self.entrees if c.startswith(prefixe) and c not in presents)
+        rapport["perimes"].sort()
+        rapport["orphelins"].sort()
+        return rapport
+
+    @staticmethod
+    def _origine_changee(entree: Dict, actuelles: Dict) -> bool:
+        """La ligne de contenu qui a produit l'asset a-t-elle changé ou disparu ?"""
+        contenu = entree.get("contenu")
+        if not contenu:
+            return False
+        ligne = actuelles.get((contenu.get("type"), str(contenu.get("content"))))
+        if ligne is None:
+            return True
+        return any(str(ligne.get(k)) != str(v) for k, v in contenu.items() if k in ligne)
@@ -0,0 +1,179 @@
+import io
+import os
+import json
+import mmap
+import struct
+from typing import Dict, List, Optional, Tuple
+
+# Format du paquet :
+#   [entête : signature, version, taille de l'index]
+#   [index JSON : {"chemin/relatif": [décalage, taille, mtime_ns, "chemin/réel"], ...}]
+#   [données : fichiers concaténés]
+# Les décalages sont relatifs au début de la zone de données. Taille et date de
+# modification de chaque source servent à écarter à l'ouverture les entrées périmées
+# (le fichier séparé est alors lu à leur place).
+SIGNATURE = b"ADYSPACK"
+VERSION = 2
+_ENTETE = struct.Struct("<8sHI")
+
+
+def normaliser(chemin: str) -> str:
+    """Clé d'index d'un asset : chemin relatif, séparateurs '/', minuscules."""
+    return os.path.normpath(chemin).replace(os.sep, "/").lower()
+
+
+def construire_paquet(dossier_assets: str, destination: str) -> int:
+    """
+    Concatène tous les fichiers de `dossier_assets` dans un seul paquet indexé.
+    Les clés sont relatives au dossier parent de `dossier_assets` (ex: 'assets/images/a.png').
+
+    Args:
+        dossier_assets: Dossier racine des assets (ex: 'assets').
+        destination: Chemin du paquet à produire (écrit de façon atomique).
+
+    Returns:
+        Le nombre de fichiers empaquetés.
+    """
+    base = os.path.dirname(os.path.abspath(dossier_assets))
+    fichiers: List[Tuple[str, str, str]] = []
+    for racine, _, noms in os.walk(dossier_assets):
+        for nom in sorted(noms):
+            if nom.startswith("."):
+                continue
+            chemin = os.path.join(racine, nom)
+            relatif = os.path.relpath(os.path.abspath(chemin), base).replace(os.sep, "/")
+            fichiers.append((normaliser(relatif), relatif, chemin))
+    fichiers.sort()
+
+    index: Dict[str, list] = {}
+    decalage = 0
+    for cle, relatif, chemin in fichiers:
+        st = os.stat(chemin)
+        index[cle] = [decalage, st.st_size, st.st_mtime_ns, relatif]
+        decalage += st.st_size
+
+    index_brut = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    temporaire = destination + ".tmp"
+    with open(temporaire, "wb") as f:
+        f.write(_ENTETE.pack(SIGNATURE, VERSION, len(index_brut)))
+        f.write(index_brut)
+        for _, _, chemin in fichiers:
+            with open(chemin, "rb") as source:
+                f.write(source.read())
+    os.replace(temporaire, destination)
+    return len(fichiers)
+
+
+class VueFichier(io.RawIOBase):
+    """Fichier en lecture seule sur une tranche du paquet (aucune copie des données)."""
+
+    def __init__(self, vue: memoryview) -> None:
+        super().__init__()
+        self._vue = vue
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, tampon) -> int:
+        n = min(len(tampon), len(self._vue) - self._position)
+        if n <= 0:
+            return 0
+        tampon[:n] = self._vue[self._position:self._position + n]
+        self._position += n
+        return n
+
+    def seek(self, decalage: int, origine: int = io.SEEK_SET) -> int:
+        if origine == io.SEEK_CUR:
+            decalage += self._position
+        elif origine == io.SEEK_END:
+            decalage += len(self._vue)
+        self._position = max(0, decalage)
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class AssetPack:
+    """
+    Paquet d'assets projeté en mémoire (mmap).
+    Un seul fichier ouvert pour toute la session : chaque asset est une vue
+    sur la projection, transmise à pygame sous forme de fichier virtuel.
+    Les sources sont vérifiées une seule fois, à l'ouverture : un asset modifié
+    depuis la construction du paquet est retiré de l'index et lu sur disque.
+    """
+
+    def __init__(self, chemin: str) -> None:
+        self.chemin = chemin
+        self._fichier = open(chemin, "rb")
+        self._mmap = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        self._vue = memoryview(self._mmap)
+
+        signature, version, taille_index = _ENTETE.unpack_from(self._mmap, 0)
+        if signature != SIGNATURE or version != VERSION:
+            self.fermer()
+            raise ValueError(f"Paquet d'assets invalide ou d'une autre version : {chemin}")
+        debut_index = _ENTETE.size
+        self._debut_donnees = debut_index + taille_index
+        self._index: Dict[str, list] = self._entrees_valides(
+            json.loads(bytes(self._vue[debut_index:self._debut_donnees])))
+
+    @staticmethod
+    def _entrees_valides(index: Dict[str, list]) -> Dict[str, list]:
+        """Écarte les assets dont la source a changé depuis la construction du paquet."""
+        valides = {}
+        for cle, (decalage, taille, mtime_ns, relatif) in index.items():
+            try:
+                st = os.stat(relatif)
+                if (st.st_size, st.st_mtime_ns) != (taille, mtime_ns):
+                    continue
+            except FileNotFoundError:
+                # Source absente (livraison sans les originaux) : le paquet fait foi
+                pass
+            valides[cle] = [decalage, taille]
+        perimes = len(index) - len(valides)
+        if perimes:
+            print(f"⚠️ Paquet d'assets : {perimes} fichiers modifiés lus sur disque (relancer build_pack.py).")
+        return valides
+
+    @classmethod
+    def ouvrir_si_present(cls, chemin: str) -> Optional["AssetPack"]:
+        """Ouvre le paquet s'il existe ; None (fichiers séparés) sinon ou s'il est illisible."""
+        if not os.path.exists(chemin):
+            return None
+        try:
+            paquet = cls(chemin)
+            print(f"📦 Paquet d'assets chargé : {len(paquet)} fichiers ({chemin}).")
+            return paquet
+        except Exception as e:
+            print(f"⚠️ Paquet d'assets ignoré ({chemin}) : {e}")
+            return None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, chemin: str) -> bool:
+        return normaliser(chemin) in self._index
+
+    def vue(self, chemin: str) -> memoryview:
+        """Tranche brute de l'asset dans la projection mémoire (zéro copie)."""
+        decalage, taille = self._index[normaliser(chemin)]
+        debut = self._debut_donnees + decalage
+        return self._vue[debut:debut + taille]
+
+    def ouvrir(self, chemin: str) -> io.BufferedReader:
+        """Fichier virtuel lisible par pygame.image.load / pygame.mixer.Sound."""
+        return io.BufferedReader(VueFichier(self.vue(chemin)))
+
+    def fermer(self) -> None:
+        try:
+            self._vue.release()
+            self._mmap.close()
+        except BufferError:
+            # Des vues sont encore utilisées : la projection sera libérée avec elles
+            pass
+        self._fichier.close()
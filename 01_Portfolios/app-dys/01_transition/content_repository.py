@@ -0,0 +1,121 @@
+from db_manager import DBManager, sort_key
+
+TABLE = "educational_content"
+
+
+class ContentRepository:
+    """
+    Accès indexé à la table educational_content, au-dessus de DBManager.
+
+    Deux modes :
+    - sans miroir, chaque question devient une requête filtrée côté serveur
+      (seules les lignes utiles transitent) ;
+    - après load(), la table entière est gardée en mémoire avec des index
+      secondaires : (type, content), mot et is_active. Une recherche est alors
+      un accès dictionnaire, sans aller-retour réseau.
+    Hors-ligne, le miroir est construit depuis le contenu de secours de DBManager.
+    """
+
+    def __init__(self, manager: DBManager = None):
+        self.manager = manager if manager is not None else DBManager()
+        self._rows = None
+        self._by_key = {}
+        self._by_word = {}
+        # (type ou None, is_active ou None) -> lignes triées
+        self._by_filter = {}
+
+    @property
+    def online(self):
+        return self.manager.client is not None
+
+    @property
+    def loaded(self):
+        return self._rows is not None
+
+    # --- Miroir local ---
+
+    def load(self):
+        """Charge toute la table (lignes inactives comprises) en un seul transfert et l'indexe."""
+        if self.online:
+            try:
+                rows = self.manager.client.table(TABLE).select("*").execute().data
+            except Exception as e:
+                print(f"⚠️ Lecture complète impossible, contenu de secours utilisé : {e}")
+                rows = self.manager.get_educational_content()
+        else:
+            rows = self.manager.get_educational_content()
+        self._index(rows)
+        return self
+
+    def invalidate(self):
+        """Oublie le miroir (à appeler après une écriture dans la table)."""
+        self._rows = None
+        self._by_key, self._by_word, self._by_filter = {}, {}, {}
+
+    def _index(self, rows):
+        self.invalidate()
+        self._rows = sorted(rows, key=sort_key)
+        for row in self._rows:
+            self._by_key[(row.get("type"), str(row.get("content")))] = row
+            word = row.get("word")
+            if word:
+                self._by_word.setdefault(word.lower(), []).append(row)
+            c_type, active = row.get("type"), row.get("is_active", True) is not False
+            for key in ((c_type, active), (None, active), (c_type, None), (None, None)):
+                self._by_filter.setdefault(key, []).append(row)
+
+    # --- Requêtes ---
+
+    def query(self, content_type=None, content=None, active=None, columns="*", count=None):
+        """
+        Requête Supabase pré-filtrée côté serveur (None hors-ligne).
+        Le résultat peut être complété (.limit, .order...) avant execute().
+        :param count: 'exact' pour obtenir aussi le nombre total de lignes (response.count)
+        """
+        if not self.online:
+            return None
+        q = self.manager.client.table(TABLE).select(columns, count=count)
+        if content_type:
+            q = q.eq("type", content_type)
+        if content is not None:
+            q = q.eq("content", str(content))
+        if active is not None:
+            q = q.eq("is_active", active)
+        return q
+
+    def get(self, content_type, content):
+        """Ligne unique (type, content), active ou non ; None si absente."""
+        if not self.loaded and self.online:
+            rows = self.query(content_type, content).limit(1).execute().data
+            return rows[0] if rows else None
+        self._ensure_loaded()
+        return self._by_key.get((content_type, str(content)))
+
+    def find_by_word(self, word):
+        """Lignes illustrées par un mot (insensible à la casse)."""
+        if not self.loaded and self.online:
+            # % et _ sont des jokers pour ilike : on les échappe pour une égalité stricte
+            motif = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return self.query().ilike("word", motif).execute().data
+        self._ensure_loaded()
+        return list(self._by_word.get(word.lower(), []))
+
+    def all(self, content_type=None, active=True):
+        """
+        Lignes triées (lettres puis chiffres numériquement).
+        :param active: True / False pour filtrer sur is_active, None pour tout
+        """
+        if not self.loaded and self.online:
+            return sorted(self.query(content_type, active=active).execute().data, key=sort_key)
+        self._ensure_loaded()
+        return list(self._by_filter.get((content_type or None, active), []))
+
+    def count(self, content_type=None, active=True):
+        """Nombre de lignes ; compté par le serveur sans transférer les données quand c'est possible."""
+        if not self.loaded and self.online:
+            return self.query(content_type, active=active, columns="id", count="exact").limit(1).execute().count
+        return len(self.all(content_type, active))
+
+    def _ensure_loaded(self):
+        if not self.loaded:
+            self.load()
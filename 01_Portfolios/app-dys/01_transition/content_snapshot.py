@@ -0,0 +1,100 @@
+import os
+import sys
+import zlib
+import marshal
+import struct
+from typing import Dict, List, Optional
+
+# Instantané binaire du contenu pédagogique (mode hors-ligne) :
+#   [entête : signature, version du format, version du schéma, version de Python,
+#             nb d'éléments, crc32, taille]
+#   [données : {type: [lignes déjà triées]} sérialisé avec marshal]
+# Le fichier est lu en un seul appel et désérialisé sans analyse JSON ni tri.
+# marshal n'est pas garanti stable d'une version de Python à l'autre : l'entête
+# note la version qui l'a écrit et un instantané d'une autre version est ignoré
+# (relancer scripts/sync_backup.py).
+SIGNATURE = b"ADYSSNAP"
+VERSION = 2
+# À incrémenter quand les colonnes de educational_content changent
+VERSION_SCHEMA = 1
+_ENTETE = struct.Struct("<8sHHBBIII")
+_VERSION_PYTHON = sys.version_info[:2]
+CHEMIN_DEFAUT = "content.snapshot"
+
+
+def ecrire_snapshot(lignes: List[Dict], chemin: str = CHEMIN_DEFAUT) -> int:
+    """
+    Regroupe les lignes par type, les trie et écrit l'instantané de façon atomique.
+
+    Args:
+        lignes: Lignes de educational_content (tous types confondus).
+        chemin: Fichier à produire.
+
+    Returns:
+        Le nombre d'éléments écrits.
+    """
+    # Import local : db_manager importe ce module au chargement
+    from db_manager import sort_key
+
+    par_type: Dict[str, List[Dict]] = {}
+    for ligne in lignes:
+        par_type.setdefault(ligne.get("type", "letter"), []).append(dict(ligne))
+    for groupe in par_type.values():
+        groupe.sort(key=sort_key)
+
+    donnees = marshal.dumps(par_type)
+    entete = _ENTETE.pack(SIGNATURE, VERSION, VERSION_SCHEMA, *_VERSION_PYTHON, len(lignes),
+                          zlib.crc32(donnees), len(donnees))
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "wb") as f:
+        f.write(entete)
+        f.write(donnees)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporaire, chemin)
+    return len(lignes)
+
+
+def lire_snapshot(chemin: str = CHEMIN_DEFAUT) -> Optional["ContentSnapshot"]:
+    """Charge l'instantané ; None s'il est absent, tronqué, corrompu ou d'une autre version."""
+    try:
+        with open(chemin, "rb") as f:
+            brut = f.read()
+        signature, version, schema, py_majeur, py_mineur, nombre, crc, taille = _ENTETE.unpack_from(brut, 0)
+        if (signature != SIGNATURE or version != VERSION or schema != VERSION_SCHEMA
+                or (py_majeur, py_mineur) != _VERSION_PYTHON):
+            print(f"⚠️ Instantané de contenu d'une autre version ignoré ({chemin}).")
+            return None
+        donnees = memoryview(brut)[_ENTETE.size:]
+        if len(donnees) != taille or zlib.crc32(donnees) != crc:
+            print(f"⚠️ Instantané de contenu corrompu ignoré ({chemin}).")
+            return None
+        return ContentSnapshot(marshal.loads(donnees), nombre, crc)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Instantané de contenu illisible ({chemin}) : {e}")
+        return None
+
+
+class ContentSnapshot:
+    """Contenu de l'instantané, déjà groupé par type et trié."""
+
+    # Ordre des types dans une requête globale (identique au tri de DBManager)
+    ORDRE_TYPES = ["letter", "number"]
+
+    def __init__(self, par_type: Dict[str, List[Dict]], nombre: int, crc: int = 0) -> None:
+        self._par_type = par_type
+        self.nombre = nombre
+        # crc32 des données : identifie l'instantané (filigrane de scripts/sync_backup.py)
+        self.crc = crc
+
+    def __len__(self) -> int:
+        return self.nombre
+
+    def lignes(self, type_contenu: Optional[str] = None) -> List[Dict]:
+        """Lignes d'un type, ou de tous les types si `type_contenu` est None (copie de la liste)."""
+        if type_contenu:
+            return list(self._par_type.get(type_contenu, []))
+        types = self.ORDRE_TYPES + sorted(t for t in self._par_type if t not in self.ORDRE_TYPES)
+        return [ligne for t in types for ligne in self._par_type.get(t, [])]
@@ -1,31 +1,154 @@
 import os
 import json
+import time
+import atexit
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-# Chargement des variables d'environnement (.env)
-load_dotenv()
+from content_snapshot import lire_snapshot
+
+# Instantané hors-ligne de tout le contenu (écrit par scripts/sync_backup.py)
+SNAPSHOT_PATH = "content.snapshot"
+# Fichiers de progression rangés à côté du module, quel que soit le dossier courant
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Ancien fichier de progression (repris une fois dans le journal SQLite)
+PROGRESS_PATH = os.path.join(_MODULE_DIR, "progress.json")
+DISCOVERY_DB_PATH = os.path.join(_MODULE_DIR, "progress.db")
+DISCOVERY_SCHEMA_VERSION = 1
+DEFAULT_CHILD = "default"
+# Délai de regroupement des écritures de progression (secondes)
+PROGRESS_FLUSH_INTERVAL = 2.0
+# Cache local du contenu pédagogique (stale-while-revalidate)
+CONTENT_CACHE_PATH = os.path.join(".cache", "content.json")
+CONTENT_CACHE_TTL = 300.0
+# Délai maximal accordé à la connexion Supabase en arrière-plan (secondes),
+# surchargeable par SUPABASE_CONNECT_TIMEOUT dans le .env
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+def connect_timeout_from_env():
+    """Délai de connexion lu après le chargement du .env (valeur par défaut si invalide)."""
+    load_dotenv()
+    value = os.getenv("SUPABASE_CONNECT_TIMEOUT")
+    if not value:
+        return DEFAULT_CONNECT_TIMEOUT
+    try:
+        return float(value)
+    except ValueError:
+        print(f"⚠️ SUPABASE_CONNECT_TIMEOUT invalide ({value!r}) : délai de {DEFAULT_CONNECT_TIMEOUT:g} s utilisé.")
+        return DEFAULT_CONNECT_TIMEOUT
+
+def sort_key(x):
+    """Ordre d'affichage : les lettres puis les chiffres, les chiffres triés numériquement."""
+    # Gestion sécurisée du type
+    c_type = x.get("type", "letter")
+    t_val = 0 if c_type == "letter" else 1
+    content = x.get("content", "")
+    try:
+        # Si c'est un nombre, on trie numériquement
+        return (t_val, int(content), content)
+    except (ValueError, TypeError):
+        return (t_val, float('inf'), content)
 
 class DBManager:
     """
     Gestionnaire de la base de données Supabase pour le projet Alphabet Kids.
     """
     
-    def __init__(self):
-        # État global du service ('online', 'offline', 'critical')
+    def __init__(self, background=False, connect_timeout=None, on_status_change=None):
+        """
+        :param background: True = connexion en tâche de fond, le constructeur rend la main
+                           immédiatement avec status='connecting' (utilisé par le jeu)
+        :param connect_timeout: Délai au-delà duquel on passe en 'offline' sans attendre la fin
+                                (par défaut SUPABASE_CONNECT_TIMEOUT du .env, sinon 5 s)
+        :param on_status_change: Rappel appelé (depuis n'importe quel thread) à chaque changement de status
+        """
+        # État global du service ('connecting', 'online', 'offline', 'critical')
         self.status = 'offline'
+        # Le status est modifié par le thread de connexion, le minuteur et le thread principal
+        self._status_lock = threading.Lock()
         self.is_online = False
-        
+        self.client = None
+        self._on_status_change = on_status_change
+        # Levé quand la connexion a abouti, échoué ou dépassé son délai
+        self._connection_settled = threading.Event()
+
+        # Cache du contenu par type : servi immédiatement, revalidé en tâche de fond
+        self._content_lock = threading.Lock()
+        self._content_cache = self._load_content_cache()
+        self._revalidating = set()
+        self._revalidator = None
+
+        # Journal des découvertes : ouvert (et migré) au premier appel de progression
+        # sur le thread principal, écriture différée (thread démarré au premier événement)
+        self._discovery_conn = None
+        self._progress_lock = threading.Condition()
+        self._pending_events = []
+        self._progress_thread = None
+        self._progress_closing = False
+
+        if not background:
+            self._connect()
+            return
+
+        if connect_timeout is None:
+            connect_timeout = connect_timeout_from_env()
+        self._set_status('connecting')
+        threading.Thread(target=self._connect, kwargs={"probe": True}, name="connexion", daemon=True).start()
+        deadline = threading.Timer(connect_timeout, self._connect_deadline)
+        deadline.daemon = True
+        deadline.start()
+
+    def _set_status(self, status, expected=None):
+        """
+        Met à jour le status et prévient l'abonné s'il a changé.
+        :param expected: Si fourni, le status n'est changé que s'il vaut encore cette valeur
+        :return: True si le status a changé
+        """
+        with self._status_lock:
+            if expected is not None and self.status != expected:
+                return False
+            changed = status != self.status
+            self.status = status
+        # Rappel hors du verrou : l'abonné peut relire le status
+        if changed and self._on_status_change:
+            self._on_status_change(status)
+        return changed
+
+    def set_status(self, status):
+        """Signale un état du service constaté par l'appelant (ex: 'critical' sans contenu)."""
+        self._set_status(status)
+
+    def _connect_deadline(self):
+        """Délai de connexion écoulé : le jeu continue hors-ligne, la connexion peut encore aboutir."""
+        if self._set_status('offline', expected='connecting'):
+            print("⏱️ Connexion Supabase trop lente : passage en mode hors-ligne.")
+        self._connection_settled.set()
+
+    def _connect(self, probe=False):
+        """
+        Lit le .env et crée le client Supabase.
+        :param probe: Vérifie aussi que le serveur répond (status 'online' seulement dans ce cas)
+        """
+        try:
+            self._open_client(probe)
+        finally:
+            self._connection_settled.set()
+
+    def _open_client(self, probe):
         # Vérification préventive du fichier .env
         if not os.path.exists(".env"):
             print("❌ ERREUR CRITIQUE : Fichier .env manquant !")
             print("Veuillez créer un fichier .env avec SUPABASE_URL et SUPABASE_KEY.")
             self.client = None
-            self.status = 'critical'
+            self._set_status('critical')
             return
 
-        # Récupération des secrets depuis le fichier .env
+        # Chargement des variables d'environnement (.env)
+        load_dotenv()
         self.url = os.getenv("SUPABASE_URL")
         self.key = os.getenv("SUPABASE_KEY")
         
@@ -33,30 +156,110 @@ class DBManager:
             print("⚠️ Erreur : SUPABASE_URL ou SUPABASE_KEY vides ou incorrects dans le .env.")
             self.client = None
             self.is_online = False
-            self.status = 'critical'
+            self._set_status('critical')
         else:
             try:
                 # Initialisation du client Supabase
-                self.client: Client = create_client(self.url, self.key)
+                client: Client = create_client(self.url, self.key)
+                if probe:
+                    client.table("educational_content").select("id").limit(1).execute()
+                self.client = client
                 self.is_online = True
-                self.status = 'online'
+                self._set_status('online')
                 print("✅ Client Supabase connecté avec succès.")
             except Exception as e:
                 print(f"❌ Impossible de se connecter à Supabase : {e}")
                 self.client = None
                 self.is_online = False
-                self.status = 'offline'
+                self._set_status('offline')
+
+    def wait_for_connection(self, timeout=None):
+        """Attend que la connexion soit tranchée (au plus le délai de connexion)."""
+        return self._connection_settled.wait(timeout)
 
 
     def get_educational_content(self, content_type: str = None):
         """
         Récupère le contenu pédagogique (lettres ou chiffres).
+        Le cache local est servi immédiatement ; s'il a dépassé CONTENT_CACHE_TTL,
+        il est revalidé en tâche de fond. Seul un cache vide attend le réseau.
+        :param content_type: Filtre optionnel ('letter' ou 'number')
+        :return: Liste de dictionnaires contenant les données
+        """
+        key = content_type or "all"
+        with self._content_lock:
+            entry = self._content_cache.get(key)
+        if entry is None:
+            return self._fetch_educational_content(content_type)
+
+        if time.time() - entry["fetched_at"] > CONTENT_CACHE_TTL:
+            self._revalidate(content_type)
+        # Copie : l'appelant peut mélanger la liste sans altérer le cache
+        return list(entry["rows"])
+
+    def _revalidate(self, content_type):
+        """Relance une lecture Supabase en tâche de fond (une seule à la fois par type)."""
+        key = content_type or "all"
+        with self._content_lock:
+            if key in self._revalidating or self.client is None:
+                return
+            self._revalidating.add(key)
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(max_workers=1, thread_name_prefix="contenu")
+
+        def run():
+            try:
+                self._fetch_educational_content(content_type)
+            finally:
+                with self._content_lock:
+                    self._revalidating.discard(key)
+        self._revalidator.submit(run)
+
+    def _store_content(self, content_type, rows):
+        """Mémorise une réponse Supabase (et ses sous-listes par type pour une requête globale)."""
+        now = time.time()
+        with self._content_lock:
+            self._content_cache[content_type or "all"] = {"rows": rows, "fetched_at": now, "source": "supabase"}
+            if content_type is None:
+                for c_type in ("letter", "number"):
+                    subset = [row for row in rows if row.get("type") == c_type]
+                    self._content_cache[c_type] = {"rows": subset, "fetched_at": now, "source": "supabase"}
+            snapshot = dict(self._content_cache)
+        self._save_content_cache(snapshot)
+
+    def _load_content_cache(self):
+        """Relit le cache du lancement précédent (périmé mais utilisable hors-ligne)."""
+        try:
+            with open(CONTENT_CACHE_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️ Cache de contenu illisible, il sera reconstruit : {e}")
+            return {}
+
+    def _save_content_cache(self, snapshot):
+        """Écrit le cache de contenu de façon atomique (fichier temporaire puis renommage)."""
+        try:
+            os.makedirs(os.path.dirname(CONTENT_CACHE_PATH), exist_ok=True)
+            tmp_path = CONTENT_CACHE_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, CONTENT_CACHE_PATH)
+        except Exception as e:
+            print(f"⚠️ Impossible d'écrire le cache de contenu : {e}")
+
+    def _fetch_educational_content(self, content_type: str = None):
+        """
+        Lecture réseau du contenu pédagogique.
         Priorité : Supabase (Cloud) puis Backup (Local) si hors-ligne.
         :param content_type: Filtre optionnel ('letter' ou 'number')
         :return: Liste de dictionnaires contenant les données
         """
         data = []
         supabase_success = False
+        # Cache froid pendant la connexion : on attend son issue (bornée par le délai)
+        self._connection_settled.wait()
 
         # 1. Tentative TOUJOURS avec Supabase en premier
         if self.client:
@@ -73,20 +276,29 @@ class DBManager:
                 data = query.data
                 supabase_success = True
                 self.is_online = True
-                self.status = 'online'
+                self._set_status('online')
                 print(f"✅ Données récupérées avec succès depuis Supabase ({len(data)} éléments).")
             except Exception as e:
                 self.is_online = False
-                self.status = 'offline'
+                self._set_status('offline')
                 print(f"⚠️ Échec de la connexion Supabase : {e}")
                 print("🔄 Passage en mode fallback (secours)...")
         else:
             self.is_online = False
-            self.status = 'offline'
+            self._set_status('offline')
             print("⚠️ Client Supabase non initialisé. Passage en mode fallback...")
 
 
-        # 2. Fallback sur le backup local si Supabase échoue (uniquement pour les lettres)
+        # 2. Fallback sur l'instantané local (tous types, déjà trié : rien à analyser ni trier)
+        if not supabase_success:
+            snapshot = lire_snapshot(SNAPSHOT_PATH)
+            if snapshot is not None:
+                data = snapshot.lignes(content_type)
+                self._set_status('offline')
+                print(f"✅ Mode secours activé : {len(data)} éléments chargés depuis {SNAPSHOT_PATH}.")
+                return data
+
+        # 2 bis. Ancien backup JSON si l'instantané manque (uniquement pour les lettres)
         if not supabase_success:
             if content_type == "letter" or content_type is None:
                 backup_path = "backup_list.json"
@@ -99,16 +311,16 @@ class DBManager:
                         if content_type is None:
                             data = [item for item in data if item.get("type") == "letter"]
                         
-                        self.status = 'offline'
+                        self._set_status('offline')
                         print(f"✅ Mode secours activé : {len(data)} lettres chargées depuis {backup_path}.")
                     except JSONDecodeError as e:
-                        self.status = 'critical'
+                        self._set_status('critical')
                         print(f"❌ ERREUR FORMAT : Le fichier backup est corrompu (JSON invalide) : {e}")
                     except Exception as e:
-                        self.status = 'critical'
+                        self._set_status('critical')
                         print(f"❌ ERREUR LECTURE : Impossible d'accéder au backup : {e}")
                 else:
-                    self.status = 'critical'
+                    self._set_status('critical')
                     print(f"❌ ERREUR CRITIQUE : Fichier de backup {backup_path} introuvable.")
             else:
                 # Si c'est pour des chiffres et que Supabase échoue, on n'a pas de backup pour ça.
@@ -117,46 +329,221 @@ class DBManager:
 
         # 3. Tri des données (commun aux deux sources)
         try:
-            def sort_key(x):
-                # Gestion sécurisée du type
-                c_type = x.get("type", "letter")
-                t_val = 0 if c_type == "letter" else 1
-                content = x.get("content", "")
-                try:
-                    # Si c'est un nombre, on trie numériquement
-                    return (t_val, int(content), content)
-                except (ValueError, TypeError):
-                    return (t_val, float('inf'), content)
-
             sorted_data = sorted(data, key=sort_key)
-            return sorted_data
+            if supabase_success:
+                self._store_content(content_type, sorted_data)
+            return list(sorted_data)
         except Exception as e:
             print(f"⚠️ Erreur lors du tri des données : {e}")
             return data
 
 
-    def load_progress(self):
-        """Charge le nombre total de découvertes depuis progress.json."""
-        path = "progress.json"
-        if not os.path.exists(path):
-            return {"total_discovered": 0}
-        
+    # --- Progression : journal SQLite des découvertes ---
+
+    @staticmethod
+    def _open_discovery_db():
+        """Ouvre une connexion à la base locale des découvertes (mode WAL)."""
+        conn = sqlite3.connect(DISCOVERY_DB_PATH, timeout=5.0)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_discovery_db(self):
+        """
+        Ouvre la connexion du thread principal et crée le schéma au besoin.
+        Au premier lancement, le total de progress.json est repris comme point de départ.
+        :return: La connexion, ou None si la base est inaccessible
+        """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⚠️ progress.json corrompu ou illisible, réinitialisation : {e}")
-            self.save_progress(0)
-            return {"total_discovered": 0}
+            conn = self._open_discovery_db()
+            self._migrate_discovery_db(conn)
+            return conn
+        except sqlite3.Error as e:
+            print(f"⚠️ Journal des découvertes inaccessible : {e}")
+            return None
 
-    def save_progress(self, count):
-        """Sauvegarde le nombre total de découvertes dans progress.json."""
-        path = "progress.json"
+    def _migrate_discovery_db(self, conn):
+        """Crée ou met à jour le schéma (appelé uniquement depuis le thread principal)."""
+        if conn.execute("PRAGMA user_version").fetchone()[0] < DISCOVERY_SCHEMA_VERSION:
+            with conn:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS discoveries (
+                        id INTEGER PRIMARY KEY,
+                        child TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        type TEXT NOT NULL,
+                        discovered_at REAL NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_discoveries_item
+                        ON discoveries (child, content, type, discovered_at);
+                    CREATE INDEX IF NOT EXISTS idx_discoveries_recent
+                        ON discoveries (child, discovered_at);
+                    CREATE TABLE IF NOT EXISTS progress_baseline (
+                        child TEXT PRIMARY KEY,
+                        total INTEGER NOT NULL
+                    );
+                """)
+                legacy_total = self._read_legacy_progress()
+                if legacy_total:
+                    conn.execute("INSERT OR IGNORE INTO progress_baseline (child, total) VALUES (?, ?)",
+                                 (DEFAULT_CHILD, legacy_total))
+                    print(f"🔁 progress.json migré : {legacy_total} découvertes reprises.")
+                conn.execute(f"PRAGMA user_version = {DISCOVERY_SCHEMA_VERSION}")
+
+    def _read_legacy_progress(self):
+        """Total de l'ancien progress.json (0 si absent ou illisible)."""
+        if not os.path.exists(PROGRESS_PATH):
+            return 0
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({"total_discovered": count}, f, indent=4)
+            with open(PROGRESS_PATH, "r", encoding="utf-8") as f:
+                return int(json.load(f).get("total_discovered", 0))
         except Exception as e:
-            print(f"❌ Erreur sauvegarde progress.json : {e}")
+            print(f"⚠️ progress.json corrompu ou illisible, migration ignorée : {e}")
+            return 0
+
+    def _discovery_db(self):
+        """Connexion du thread principal, ouverte et migrée au premier appel (None si inaccessible)."""
+        if self._discovery_conn is None:
+            self._discovery_conn = self._init_discovery_db()
+        return self._discovery_conn
+
+    def _query(self, sql, params=()):
+        """Lecture sur la connexion du thread principal (None si la base est inaccessible)."""
+        conn = self._discovery_db()
+        if conn is None:
+            return None
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"⚠️ Journal des découvertes illisible : {e}")
+            return None
+
+    def load_progress(self, child=DEFAULT_CHILD):
+        """Charge le nombre total de découvertes depuis le journal local."""
+        return {"total_discovered": self.get_total_discovered(child)}
+
+    def get_total_discovered(self, child=DEFAULT_CHILD):
+        """Total des découvertes d'un enfant (reprise de progress.json comprise)."""
+        rows = self._query(
+            "SELECT (SELECT COUNT(*) FROM discoveries WHERE child = ?)"
+            " + COALESCE((SELECT total FROM progress_baseline WHERE child = ?), 0)",
+            (child, child))
+        return rows[0][0] if rows else 0
+
+    def get_discovery_counts(self, child=DEFAULT_CHILD, content_type=None):
+        """
+        Nombre de découvertes par élément.
+        :param content_type: Filtre optionnel ('letter' ou 'number')
+        :return: Dictionnaire {(content, type): nombre}
+        """
+        sql = "SELECT content, type, COUNT(*) FROM discoveries WHERE child = ?"
+        params = [child]
+        if content_type:
+            sql += " AND type = ?"
+            params.append(content_type)
+        rows = self._query(sql + " GROUP BY content, type", params) or []
+        return {(content, c_type): count for content, c_type, count in rows}
+
+    def get_recent_discoveries(self, child=DEFAULT_CHILD, limit=20):
+        """Dernières découvertes, de la plus récente à la plus ancienne."""
+        rows = self._query(
+            "SELECT content, type, discovered_at FROM discoveries WHERE child = ?"
+            " ORDER BY discovered_at DESC LIMIT ?", (child, limit)) or []
+        return [{"content": c, "type": t, "discovered_at": ts} for c, t, ts in rows]
+
+    def record_discovery(self, content, content_type, child=DEFAULT_CHILD):
+        """
+        Programme l'enregistrement d'une découverte (écriture différée).
+        Seul le premier appel touche au disque (ouverture et migration du journal, avant
+        le démarrage du thread d'écriture) : le thread d'écriture regroupe ensuite les
+        événements et les insère en une transaction au plus tard après PROGRESS_FLUSH_INTERVAL secondes.
+        :param content: Élément découvert (ex: 'A', '7')
+        :param content_type: 'letter' ou 'number'
+        """
+        with self._progress_lock:
+            self._pending_events.append((child, str(content), content_type, time.time()))
+            if self._progress_thread is None:
+                # Schéma prêt avant que le thread d'écriture n'ouvre sa propre connexion
+                self._discovery_db()
+                self._progress_thread = threading.Thread(target=self._progress_writer,
+                                                         name="progression", daemon=True)
+                self._progress_thread.start()
+                # Filet de sécurité si close() n'est pas appelé
+                atexit.register(self.close)
+            self._progress_lock.notify()
+
+    def flush_progress(self, conn=None):
+        """
+        Écrit immédiatement les découvertes en attente (appel bloquant).
+        :param conn: Connexion du thread d'écriture ; par défaut celle du thread principal
+        """
+        with self._progress_lock:
+            events, self._pending_events = self._pending_events, []
+        if not events:
+            return
+        if conn is None:
+            conn = self._discovery_db()
+        self._write_discoveries(conn, events)
+
+    def close(self):
+        """Arrête le thread d'écriture après avoir enregistré les dernières découvertes."""
+        with self._progress_lock:
+            self._progress_closing = True
+            self._progress_lock.notify()
+            thread = self._progress_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush_progress()
+        if self._revalidator is not None:
+            self._revalidator.shutdown(wait=False, cancel_futures=True)
+        if self._discovery_conn is not None:
+            self._discovery_conn.close()
+            self._discovery_conn = None
+
+    def _progress_writer(self):
+        """
+        Boucle du thread d'écriture : attend un événement, laisse les suivants s'accumuler, écrit.
+        Une seule connexion est ouverte pour toute la durée du thread.
+        """
+        try:
+            conn = self._open_discovery_db()
+        except sqlite3.Error as e:
+            print(f"❌ Journal des découvertes inaccessible en écriture : {e}")
+            conn = None
+        try:
+            self._write_loop(conn)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _write_loop(self, conn):
+        while True:
+            with self._progress_lock:
+                while not self._pending_events and not self._progress_closing:
+                    self._progress_lock.wait()
+                if self._progress_closing:
+                    return
+                # Regroupement : les découvertes rapprochées ne produisent qu'une transaction
+                deadline = time.monotonic() + PROGRESS_FLUSH_INTERVAL
+                while not self._progress_closing and time.monotonic() < deadline:
+                    self._progress_lock.wait(deadline - time.monotonic())
+                if self._progress_closing:
+                    return
+            if conn is not None:
+                self.flush_progress(conn)
+
+    def _write_discoveries(self, conn, events):
+        """Insère un lot d'événements en une transaction sur la connexion fournie."""
+        if conn is None:
+            print(f"❌ Journal des découvertes inaccessible : {len(events)} découvertes non enregistrées.")
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO discoveries (child, content, type, discovered_at) VALUES (?, ?, ?, ?)",
+                    events)
+        except sqlite3.Error as e:
+            print(f"❌ Erreur enregistrement des découvertes : {e}")
 
 # --- TEST RAPIDE (S'exécute uniquement si le fichier est lancé directement) ---
 if __name__ == "__main__":
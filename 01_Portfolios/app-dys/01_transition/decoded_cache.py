@@ -0,0 +1,165 @@
+import os
+import json
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from asset_pack import normaliser
+
+# Cache des assets pré-décodés :
+#   <dossier>/index.json      -> chemin normalisé -> blob + métadonnées
+#   <dossier>/<empreinte>.pcm -> échantillons bruts au format du mixer
+#   <dossier>/<empreinte>.rgba -> pixels RGBA bruts
+# L'empreinte couvre le fichier source ET les paramètres de décodage :
+# un changement de format du mixer produit d'autres blobs.
+VERSION = 2
+DOSSIER_DEFAUT = os.path.join(".cache", "decoded")
+
+
+def _empreinte(chemin: str, parametres: Tuple) -> str:
+    h = hashlib.sha256(repr((VERSION, parametres)).encode("utf-8"))
+    with open(chemin, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+
+def _signature_source(chemin: str) -> List[int]:
+    """Taille et date de modification du fichier source (détection des blobs périmés)."""
+    st = os.stat(chemin)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def construire_cache(travaux: List[Tuple[str, str]], dossier: str = DOSSIER_DEFAUT) -> Dict[str, int]:
+    """
+    Décode chaque asset et écrit son blob brut dans le cache.
+    Le mixer pygame doit être initialisé avec le format utilisé par le jeu.
+
+    Args:
+        travaux: Liste de (type, chemin) avec type 'images' ou 'sons'.
+        dossier: Dossier du cache.
+
+    Returns:
+        Compteurs {'ecrits', 'inchanges', 'erreurs'}.
+    """
+    format_mixer = list(pygame.mixer.get_init() or [])
+    os.makedirs(dossier, exist_ok=True)
+    index = _lire_index(dossier) or {}
+    if index.get("mixer") != format_mixer:
+        index = {}
+    entrees = index.get("assets", {})
+    compteurs = {"ecrits": 0, "inchanges": 0, "erreurs": 0}
+
+    for type_res, chemin in travaux:
+        try:
+            parametres = (type_res, tuple(format_mixer)) if type_res == "sons" else (type_res, "RGBA")
+            empreinte = _empreinte(chemin, parametres)
+            extension = "pcm" if type_res == "sons" else "rgba"
+            blob = f"{empreinte}.{extension}"
+            chemin_blob = os.path.join(dossier, blob)
+            precedente = entrees.get(normaliser(chemin))
+
+            # Même contenu, mêmes paramètres : le blob existant est réutilisé sans décoder
+            if precedente and precedente.get("blob") == blob and os.path.exists(chemin_blob):
+                entree = dict(precedente, chemin=chemin, source=_signature_source(chemin))
+                compteurs["inchanges"] += 1
+            else:
+                entree = {"type": type_res, "blob": blob, "chemin": chemin, "source": _signature_source(chemin)}
+                if type_res == "images":
+                    surface = pygame.image.load(chemin)
+                    entree["taille"] = list(surface.get_size())
+                    donnees = pygame.image.tobytes(surface, "RGBA")
+                else:
+                    donnees = pygame.mixer.Sound(chemin).get_raw()
+                with open(chemin_blob + ".tmp", "wb") as f:
+                    f.write(donnees)
+                os.replace(chemin_blob + ".tmp", chemin_blob)
+                compteurs["ecrits"] += 1
+            entrees[normaliser(chemin)] = entree
+        except Exception as e:
+            print(f"❌ Décodage impossible pour {chemin} : {e}")
+            compteurs["erreurs"] += 1
+
+    index = {"version": VERSION, "mixer": format_mixer, "assets": entrees}
+    with open(os.path.join(dossier, "index.json.tmp"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+    os.replace(os.path.join(dossier, "index.json.tmp"), os.path.join(dossier, "index.json"))
+    return compteurs
+
+
+def _lire_index(dossier: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(dossier, "index.json"), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        return index if index.get("version") == VERSION else None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠️ Index du cache décodé illisible : {e}")
+        return None
+
+
+class DecodedCache:
+    """
+    Lecture des assets pré-décodés : le son est remis tel quel au mixer
+    (Sound(buffer=...)) et l'image reconstruite depuis ses pixels bruts,
+    sans passer par les décodeurs mp3 / png.
+    Les sources sont vérifiées une seule fois, à l'ouverture : les entrées
+    périmées sont écartées et charger() ne touche plus au disque source.
+    """
+
+    def __init__(self, dossier: str, index: Dict) -> None:
+        self.dossier = dossier
+        self._entrees: Dict[str, Dict] = self._entrees_valides(index.get("assets", {}))
+        self._mixer: List[int] = index.get("mixer", [])
+
+    @staticmethod
+    def _entrees_valides(entrees: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Écarte les blobs dont la source a changé depuis la construction du cache."""
+        valides = {}
+        for cle, entree in entrees.items():
+            try:
+                # Chemin réel (la clé normalisée est en minuscules)
+                if _signature_source(entree.get("chemin", cle)) != entree["source"]:
+                    continue
+            except FileNotFoundError:
+                # Source absente (livraison sans les originaux) : le blob fait foi
+                pass
+            valides[cle] = entree
+        perimees = len(entrees) - len(valides)
+        if perimees:
+            print(f"⚠️ Cache décodé : {perimees} entrées périmées ignorées (relancer build_decoded_cache.py).")
+        return valides
+
+    @classmethod
+    def ouvrir_si_present(cls, dossier: str = DOSSIER_DEFAUT) -> Optional["DecodedCache"]:
+        """Ouvre le cache s'il a été construit ; None sinon."""
+        index = _lire_index(dossier)
+        if not index:
+            return None
+        print(f"🧊 Cache d'assets décodés : {len(index.get('assets', {}))} entrées ({dossier}).")
+        return cls(dossier, index)
+
+    def __contains__(self, chemin: str) -> bool:
+        return normaliser(chemin) in self._entrees
+
+    def charger(self, type_res: str, chemin: str):
+        """
+        Retourne l'asset décodé, ou None si absent, périmé ou incompatible
+        (l'appelant retombe alors sur le décodage classique).
+        """
+        entree = self._entrees.get(normaliser(chemin))
+        if not entree or entree["type"] != type_res:
+            return None
+        if type_res == "sons" and list(pygame.mixer.get_init() or []) != self._mixer:
+            return None
+
+        try:
+            with open(os.path.join(self.dossier, entree["blob"]), "rb") as f:
+                donnees = f.read()
+            if type_res == "sons":
+                return pygame.mixer.Sound(buffer=donnees)
+            return pygame.image.frombytes(donnees, tuple(entree["taille"]), "RGBA")
+        except Exception as e:
+            print(f"⚠️ Blob décodé illisible pour {chemin} : {e}")
+            return None
@@ -1,9 +1,20 @@
 import pygame
 import os
 import random
+import csv
+import json
+import time
+import struct
+import hashlib
+import numpy as np
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, auto
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Callable, List, Dict, Optional, Set, Tuple
 from db_manager import DBManager
+from asset_pack import AssetPack
+from decoded_cache import DecodedCache
 
 class Config:
     """
@@ -27,7 +38,62 @@ class Config:
     # Délais (ms)
     DELAI_SON: int = 2000    # Temps avant le son automatique
     DELAI_IMAGE: int = 10000 # Temps avant l'indice visuel
-    DELAI_SPLASH: int = 3000 # Durée de l'écran de splash
+    DELAI_SPLASH: int = 3000 # Durée du splash quand aucun chargeur n'est actif
+    DELAI_SPLASH_MAX: int = 15000 # Le menu s'affiche même si le chargement traîne
+
+    # Boucle principale
+    FPS: int = 60                   # Cadence pendant les animations
+    BOUCLE_ECONOME: bool = True     # False = ancienne boucle fixe à FPS en permanence
+
+    # Confettis (célébration)
+    CONFETTIS_MAX: int = 200        # Capacité du système de particules
+    CONFETTIS_INITIAUX: int = 160   # Particules lâchées au lancement de la fête
+    CONFETTIS_PAR_FRAME: int = 1    # Particules ré-émises à chaque frame
+    ATLAS_NIVEAUX_COULEUR: int = 4  # Paliers par canal RVB (4³ = 64 teintes)
+    ATLAS_NIVEAUX_TAILLE: int = 4   # Paliers de taille entre 10 et 25 px
+    ATLAS_PAS_ANGLE: int = 10       # Pas de rotation des sprites (degrés)
+
+    # Cache de textes rendus
+    CACHE_TEXTES_MAX: int = 64      # Nombre de textes composés gardés en mémoire
+
+    # Rendu par zones modifiées (dirty rects)
+    RENDU_PARTIEL: bool = True      # False = ancien rendu plein écran à chaque frame
+    RENDU_PARTIEL_MAX_ZONES: int = 600  # Au-delà, un flip complet est moins coûteux
+
+    # Cache disque des scènes statiques (dégradé, titre du splash)
+    DOSSIER_CACHE_SCENES: str = os.path.join(".cache", "scenes")
+
+    # Chemins des polices système résolus une fois puis gardés entre deux lancements
+    FICHIER_CACHE_POLICES: str = os.path.join(".cache", "polices.json")
+
+    # Arrière-plans flous préparés en tâche de fond
+    FONDS_CACHE_MAX: int = 5        # Courant, précédent, suivant + marge (≈ 8 Mo chacun)
+
+    # Budgets mémoire du cache d'assets (octets décodés)
+    BUDGET_IMAGES_OCTETS: int = 128 * 1024 * 1024
+    BUDGET_SONS_OCTETS: int = 64 * 1024 * 1024
+
+    # Paquet unique d'assets (construit par scripts/build_pack.py)
+    FICHIER_PAQUET: str = "assets.pack"
+
+    # Pré-chargement parallèle pendant le splash
+    CHARGEUR_THREADS: int = 4
+
+    # Profileur de frames (HUD sur F3)
+    PROFILEUR_FENETRE: int = 240        # Frames prises en compte pour p50/p95/max
+    PROFILEUR_TRACE_MAX: int = 200000   # Lignes CSV gardées au maximum
+    DOSSIER_LOGS: str = "logs"
+
+    # Résolution interne dynamique (rendu réduit puis agrandi à la présentation)
+    RESOLUTION_DYNAMIQUE: bool = True   # False = rendu toujours en pleine résolution
+    BUDGET_FRAME_MS: float = 16.6       # Budget d'une frame à 60 fps
+    GOUVERNEUR_FENETRE: int = 120       # Frames animées observées avant de décider
+    GOUVERNEUR_MARGE: float = 0.5       # Remonte d'un palier si p95 < marge × budget
+
+# Événement posté par les threads de travail pour réveiller la boucle principale
+EVENEMENT_FOND_PRET: int = pygame.event.custom_type()
+EVENEMENT_ASSET_PRET: int = pygame.event.custom_type()
+EVENEMENT_STATUT_DB: int = pygame.event.custom_type()
 
 class GameState(Enum):
     """États possibles du cycle de vie du jeu."""
@@ -38,62 +104,497 @@ class GameState(Enum):
     CELEBRATION = auto()
 
 
-class ConfettiParticle:
-    """Représente une particule de confetti pour l'écran de célébration."""
-    def __init__(self, x: int, y: int) -> None:
-        self.x: int = x
-        self.y: int = y
-        self.size: int = random.randint(10, 25)
-        self.color: Tuple[int, int, int] = (
-            random.randint(50, 255), 
-            random.randint(50, 255), 
-            random.randint(50, 255)
-        )
-        self.speed: int = random.randint(5, 12)
-        self.angle: float = random.uniform(0, 6.28)
+class ConfettiSystem:
+    """
+    Système de confettis en "structure de tableaux" (NumPy).
+    Chaque attribut (x, y, vitesse, angle, couleur, taille) est un tableau :
+    toute la nuée est mise à jour en une seule opération vectorisée et les
+    emplacements des particules mortes sont recyclés sur place (aucune allocation).
+    """
+    def __init__(self, capacite: int = Config.CONFETTIS_MAX) -> None:
+        self.capacite: int = capacite
+        # Plafond de particules vivantes, abaissé par le gouverneur de frame
+        self.limite: int = capacite
+        self._rng = np.random.default_rng()
+        self.x = np.zeros(capacite, dtype=np.float32)
+        self.y = np.zeros(capacite, dtype=np.float32)
+        self.vitesse = np.zeros(capacite, dtype=np.float32)
+        self.angle = np.zeros(capacite, dtype=np.float32)
+        self.couleur = np.zeros((capacite, 3), dtype=np.uint8)
+        self.taille = np.zeros(capacite, dtype=np.int16)
+        self.actif = np.zeros(capacite, dtype=bool)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.actif))
+
+    def reinitialiser(self) -> None:
+        """Éteint toutes les particules (les emplacements restent alloués)."""
+        self.actif[:] = False
+
+    def emettre(self, nombre: int, y_min: int, y_max: int) -> int:
+        """
+        Active jusqu'à `nombre` particules dans les emplacements libres.
 
-    def update(self) -> None:
-        """Met à jour la position et la rotation de la particule."""
-        self.y += self.speed
-        self.x += int(random.uniform(-2, 2))
+        Args:
+            nombre: Nombre de particules souhaitées.
+            y_min: Ordonnée minimale d'apparition.
+            y_max: Ordonnée maximale d'apparition.
+
+        Returns:
+            Le nombre de particules réellement émises (limité par la capacité).
+        """
+        nombre = min(nombre, self.limite - len(self))
+        if nombre <= 0:
+            return 0
+        libres = np.flatnonzero(~self.actif)[:nombre]
+        n = len(libres)
+        if n == 0:
+            return 0
+
+        rng = self._rng
+        self.x[libres] = rng.integers(0, Config.LARGEUR_ECRAN, n, endpoint=True)
+        self.y[libres] = rng.integers(y_min, y_max, n, endpoint=True)
+        self.vitesse[libres] = rng.integers(5, 12, n, endpoint=True)
+        self.angle[libres] = rng.uniform(0, 6.28, n)
+        self.couleur[libres] = rng.integers(50, 255, (n, 3), endpoint=True)
+        self.taille[libres] = rng.integers(10, 25, n, endpoint=True)
+        self.actif[libres] = True
+        return n
+
+    def mettre_a_jour(self) -> None:
+        """Fait avancer toute la nuée d'un pas et libère les particules sorties de l'écran."""
+        # Les emplacements morts sont aussi calculés : c'est moins cher qu'un masque.
+        self.y += self.vitesse
+        self.x += np.trunc(self._rng.uniform(-2, 2, self.capacite))
         self.angle += 0.1
+        self.actif &= self.y <= Config.HAUTEUR_ECRAN + 50
+
+    def particules_actives(self) -> Tuple[np.ndarray, ...]:
+        """Retourne (x, y, taille, angle en degrés, couleur) des seules particules vivantes."""
+        idx = np.flatnonzero(self.actif)
+        return (
+            self.x[idx].astype(np.int32),
+            self.y[idx].astype(np.int32),
+            self.taille[idx],
+            (self.angle[idx] * 50).astype(np.int32),
+            self.couleur[idx],
+        )
+
+class ConfettiAtlas:
+    """
+    Atlas de sprites de confettis pré-tournés.
+    Chaque combinaison (teinte, taille, angle) est rendue une seule fois, à la
+    première demande, puis réutilisée : le rendu d'une frame se résume à des blits.
+    """
+    def __init__(self, echelle: float = 1.0) -> None:
+        self.echelle: float = echelle
+        self.n_couleurs: int = Config.ATLAS_NIVEAUX_COULEUR
+        self.n_tailles: int = Config.ATLAS_NIVEAUX_TAILLE
+        self.n_angles: int = 360 // Config.ATLAS_PAS_ANGLE
+        total = self.n_couleurs ** 3 * self.n_tailles * self.n_angles
+        self._sprites: List[Optional[pygame.Surface]] = [None] * total
+
+    def cles(self, tailles: np.ndarray, angles: np.ndarray, couleurs: np.ndarray) -> np.ndarray:
+        """Calcule (vectorisé) l'index de sprite de chaque particule."""
+        nc = self.n_couleurs
+        canaux = np.clip((couleurs.astype(np.int32) - 50) * nc // 206, 0, nc - 1)
+        i_couleur = (canaux[:, 0] * nc + canaux[:, 1]) * nc + canaux[:, 2]
+        i_taille = np.clip((tailles.astype(np.int32) - 10) * self.n_tailles // 16, 0, self.n_tailles - 1)
+        i_angle = (angles % 360) // Config.ATLAS_PAS_ANGLE
+        return (i_couleur * self.n_tailles + i_taille) * self.n_angles + i_angle
+
+    def sprite(self, cle: int) -> pygame.Surface:
+        """Retourne le sprite d'index `cle`, en le rendant au premier appel."""
+        sprite = self._sprites[cle]
+        if sprite is None:
+            sprite = self._rendre(cle)
+            self._sprites[cle] = sprite
+        return sprite
+
+    def _rendre(self, cle: int) -> pygame.Surface:
+        """Dessine et fait pivoter le carré correspondant à un index de l'atlas."""
+        nc = self.n_couleurs
+        reste, i_angle = divmod(cle, self.n_angles)
+        i_couleur, i_taille = divmod(reste, self.n_tailles)
+        # Valeur représentative = milieu de chaque palier
+        canaux = (i_couleur // (nc * nc), (i_couleur // nc) % nc, i_couleur % nc)
+        couleur = tuple(int(50 + (c + 0.5) * 206 / nc) for c in canaux)
+        taille = max(1, int((10 + (i_taille + 0.5) * 16 / self.n_tailles) * self.echelle))
+
+        p_surf = pygame.Surface((taille, taille), pygame.SRCALPHA)
+        pygame.draw.rect(p_surf, couleur, (0, 0, taille, taille))
+        return pygame.transform.rotate(p_surf, i_angle * Config.ATLAS_PAS_ANGLE)
+
+    @property
+    def nb_sprites_rendus(self) -> int:
+        return sum(1 for s in self._sprites if s is not None)
+
+class TextCache:
+    """
+    Cache LRU des textes rendus.
+    Chaque entrée est une surface unique où le contour est déjà incrusté :
+    afficher un texte, même avec contour, ne coûte plus qu'un seul blit.
+    """
+    DECALAGES_CONTOUR = [(-1, -1), (-1, 1), (1, -1), (1, 1), (0, -1), (0, 1), (-1, 0), (1, 0)]
+
+    def __init__(self, capacite: int = Config.CACHE_TEXTES_MAX) -> None:
+        self.capacite: int = capacite
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def obtenir(self, texte: str, font: pygame.font.Font, couleur: Tuple,
+                contour: Optional[Tuple] = None, epaisseur: int = 5) -> pygame.Surface:
+        """Retourne la surface composée du texte, en la rendant au premier appel."""
+        cle = (texte, font, couleur, contour, epaisseur if contour else 0)
+        surf = self._surfaces.get(cle)
+        if surf is not None:
+            self._surfaces.move_to_end(cle)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self._composer(texte, font, couleur, contour, epaisseur)
+        self._surfaces[cle] = surf
+        if len(self._surfaces) > self.capacite:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def _composer(self, texte: str, font: pygame.font.Font, couleur: Tuple,
+                  contour: Optional[Tuple], epaisseur: int) -> pygame.Surface:
+        """Rend le texte une fois et le contour une fois, puis les assemble."""
+        remplissage = font.render(texte, True, couleur)
+        if not contour:
+            return remplissage
+
+        trait = font.render(texte, True, contour)
+        w, h = remplissage.get_size()
+        surf = pygame.Surface((w + 2 * epaisseur, h + 2 * epaisseur), pygame.SRCALPHA)
+        for dx, dy in self.DECALAGES_CONTOUR:
+            surf.blit(trait, (epaisseur + dx * epaisseur, epaisseur + dy * epaisseur))
+        surf.blit(remplissage, (epaisseur, epaisseur))
+        return surf
+
+    def statistiques(self) -> Dict[str, int]:
+        """Compteurs exposés pour dimensionner le cache."""
+        return {"hits": self.hits, "misses": self.misses, "entrees": len(self._surfaces)}
+
+    def vider(self) -> None:
+        self._surfaces.clear()
+
+class FontRegistry:
+    """
+    Registre des polices partagé par tout le processus.
+    Le chemin de chaque famille est résolu une seule fois (l'énumération des
+    polices système est lente) et mémorisé sur disque pour les lancements
+    suivants ; chaque couple (famille, taille) correspond à un seul objet Font.
+    Les familles introuvables sont aussi mémorisées ; elles sont recherchées de
+    nouveau quand les dossiers de polices du système changent (installation).
+    """
+    VERSION = 2
+    # Dossiers de polices dont la date de modification invalide les familles absentes
+    DOSSIERS_SYSTEME = [
+        os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+        "/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts"),
+        "/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.local/share/fonts"),
+        os.path.expanduser("~/.fonts"),
+    ]
+    _partage: Optional["FontRegistry"] = None
+
+    def __init__(self, fichier: str = Config.FICHIER_CACHE_POLICES) -> None:
+        self.fichier = fichier
+        self._polices: Dict[Tuple[str, int], pygame.font.Font] = {}
+        self._signature: List = self._signature_dossiers()
+        self._chemins: Dict[str, str] = {}
+        self._absentes: Set[str] = set()
+        self._charger_chemins()
+        self.resolutions: int = 0
+
+    @classmethod
+    def partage(cls) -> "FontRegistry":
+        """Instance commune à tous les moteurs de rendu."""
+        if cls._partage is None:
+            cls._partage = cls()
+        return cls._partage
+
+    def obtenir(self, famille: str, taille: int, stricte: bool = False) -> pygame.font.Font:
+        """
+        Retourne la police (famille, taille), créée au premier appel seulement.
+
+        Args:
+            stricte: Si True, lève FileNotFoundError quand la famille est introuvable
+                au lieu de retomber sur la police par défaut de pygame (comme SysFont).
+        """
+        cle = (famille, taille)
+        police = self._polices.get(cle)
+        if police is None:
+            chemin = self._chemin(famille)
+            if chemin is None and stricte:
+                raise FileNotFoundError(f"Police introuvable : {famille}")
+            police = pygame.font.Font(chemin, taille)
+            self._polices[cle] = police
+        return police
+
+    def _chemin(self, famille: str) -> Optional[str]:
+        """Fichier de la famille, ou None si elle n'est pas installée."""
+        if famille in self._absentes:
+            return None
+        chemin = self._chemins.get(famille)
+        if not chemin or not os.path.exists(chemin):
+            chemin = pygame.font.match_font(famille)
+            self.resolutions += 1
+            if chemin:
+                self._chemins[famille] = chemin
+            else:
+                self._absentes.add(famille)
+                self._chemins.pop(famille, None)
+            self._sauver_chemins()
+        return chemin or None
+
+    @classmethod
+    def _signature_dossiers(cls) -> List:
+        """Date de modification de chaque dossier de polices présent sur la machine."""
+        signature = []
+        for dossier in cls.DOSSIERS_SYSTEME:
+            try:
+                signature.append([dossier, os.stat(dossier).st_mtime_ns])
+            except OSError:
+                continue
+        return signature
+
+    def _charger_chemins(self) -> None:
+        try:
+            with open(self.fichier, "r", encoding="utf-8") as f:
+                donnees = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"⚠️ Cache des polices illisible ({self.fichier}), nouvelle résolution : {e}")
+            return
+        if not isinstance(donnees, dict) or donnees.get("version") != self.VERSION:
+            return
+        self._chemins = donnees.get("chemins", {})
+        # Les absences ne valent que pour les mêmes dossiers de polices
+        if donnees.get("signature") == self._signature:
+            self._absentes = set(donnees.get("absentes", []))
+
+    def _sauver_chemins(self) -> None:
+        """Écrit la table famille -> fichier (et les familles absentes) de façon atomique."""
+        try:
+            os.makedirs(os.path.dirname(self.fichier) or ".", exist_ok=True)
+            donnees = {"version": self.VERSION, "signature": self._signature,
+                       "chemins": self._chemins, "absentes": sorted(self._absentes)}
+            with open(self.fichier + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(donnees, f, indent=1, ensure_ascii=False)
+            os.replace(self.fichier + ".tmp", self.fichier)
+        except Exception as e:
+            print(f"⚠️ Impossible d'écrire le cache des polices : {e}")
+
+    def statistiques(self) -> Dict[str, int]:
+        return {"polices": len(self._polices), "familles": len(self._chemins),
+                "absentes": len(self._absentes), "resolutions": self.resolutions}
+
+class SceneCache:
+    """
+    Cache disque versionné des surfaces statiques coûteuses à produire.
+    Chaque surface est stockée en pixels bruts, sous un nom dérivé de ses
+    paramètres (résolution, couleurs, police...) : un lancement à chaud
+    relit le fichier au lieu de recalculer l'image.
+    """
+    VERSION = 1  # À incrémenter si le rendu d'une scène change
+    _ENTETE = struct.Struct("<4sHIIB")  # signature, version, largeur, hauteur, alpha
+
+    def __init__(self, dossier: str = Config.DOSSIER_CACHE_SCENES) -> None:
+        self.dossier = dossier
+
+    def obtenir(self, nom: str, parametres: Tuple, generer: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Retourne la surface en cache ou la génère puis l'enregistre.
+
+        Args:
+            nom: Nom lisible de la scène (préfixe du fichier).
+            parametres: Tout ce qui influence les pixels produits.
+            generer: Fonction de rendu appelée si le cache est absent ou périmé.
+        """
+        chemin = self._chemin(nom, parametres)
+        surface = self._charger(chemin)
+        if surface is None:
+            surface = generer()
+            self._sauver(chemin, surface)
+        return surface
+
+    def _chemin(self, nom: str, parametres: Tuple) -> str:
+        empreinte = hashlib.sha1(repr((self.VERSION, nom, parametres)).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.dossier, f"{nom}_{empreinte}.raw")
+
+    def _charger(self, chemin: str) -> Optional[pygame.Surface]:
+        """Relit une surface brute ; None si absente, tronquée ou d'une autre version."""
+        try:
+            with open(chemin, "rb") as f:
+                signature, version, w, h, alpha = self._ENTETE.unpack(f.read(self._ENTETE.size))
+                pixels = f.read()
+            if signature != b"SCNE" or version != self.VERSION:
+                return None
+            fmt = "RGBA" if alpha else "RGB"
+            surface = pygame.image.frombytes(pixels, (w, h), fmt)
+            return surface.convert_alpha() if alpha else surface.convert()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Cache de scène illisible ({chemin}), régénération : {e}")
+            return None
+
+    def _sauver(self, chemin: str, surface: pygame.Surface) -> None:
+        """Écrit la surface de façon atomique (fichier temporaire puis renommage)."""
+        alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        fmt = "RGBA" if alpha else "RGB"
+        w, h = surface.get_size()
+        try:
+            os.makedirs(self.dossier, exist_ok=True)
+            temporaire = chemin + ".tmp"
+            with open(temporaire, "wb") as f:
+                f.write(self._ENTETE.pack(b"SCNE", self.VERSION, w, h, int(alpha)))
+                f.write(pygame.image.tobytes(surface, fmt))
+            os.replace(temporaire, chemin)
+        except Exception as e:
+            print(f"⚠️ Impossible d'écrire le cache de scène {chemin} : {e}")
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Dessine la particule avec une légère rotation."""
-        p_surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.rect(p_surf, self.color, (0, 0, self.size, self.size))
-        rotated = pygame.transform.rotate(p_surf, int(self.angle * 50))
-        screen.blit(rotated, (self.x, self.y))
+class BackgroundPreparer:
+    """
+    Prépare en tâche de fond les arrière-plans flous des éléments voisins.
+    Les résultats sont gardés dans un cache borné (LRU) : le gestionnaire de
+    touches n'a plus qu'à échanger une surface déjà prête.
+    """
+    def __init__(self, capacite: int = Config.FONDS_CACHE_MAX) -> None:
+        self.capacite: int = capacite
+        self._executeur = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fonds")
+        # Valeur : travail en cours (Future) ou surface prête (déjà convertie)
+        self._fonds: "OrderedDict[str, object]" = OrderedDict()
+
+    def demander(self, cle: str, image: pygame.Surface) -> None:
+        """Planifie le flou de `image` s'il n'est ni prêt ni déjà en cours."""
+        if cle in self._fonds:
+            self._fonds.move_to_end(cle)
+            return
+
+        travail = self._executeur.submit(self._flouter, image)
+        # Réveille la boucle principale (qui peut dormir dans event.wait)
+        travail.add_done_callback(lambda _: pygame.event.post(pygame.event.Event(EVENEMENT_FOND_PRET, cle=cle)))
+        self._fonds[cle] = travail
+        while len(self._fonds) > self.capacite:
+            _, ancien = self._fonds.popitem(last=False)
+            if isinstance(ancien, Future):
+                ancien.cancel()
+
+    def obtenir(self, cle: str) -> Optional[pygame.Surface]:
+        """Retourne le fond s'il est prêt, sans jamais attendre le thread de travail."""
+        fond = self._fonds.get(cle)
+        if isinstance(fond, Future):
+            if not fond.done():
+                return None
+            try:
+                # convert() doit être appelé depuis le thread principal
+                fond = fond.result().convert()
+            except Exception as e:
+                print(f"❌ Erreur préparation du fond {cle} : {e}")
+                del self._fonds[cle]
+                return None
+            self._fonds[cle] = fond
+        if fond is not None:
+            self._fonds.move_to_end(cle)
+        return fond
+
+    @staticmethod
+    def _flouter(image: pygame.Surface) -> pygame.Surface:
+        """Agrandit, floute (réduction puis agrandissement) et assombrit l'image."""
+        fond = pygame.transform.smoothscale(image, (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
+        facteur = 12
+        pete = pygame.transform.smoothscale(fond, (Config.LARGEUR_ECRAN // facteur, Config.HAUTEUR_ECRAN // facteur))
+        fond = pygame.transform.smoothscale(pete, (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
+
+        filtre = pygame.Surface((Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
+        filtre.fill(Config.NOIR)
+        filtre.set_alpha(130)
+        fond.blit(filtre, (0, 0))
+        return fond
+
+    def fermer(self) -> None:
+        """Arrête le thread de travail sans attendre les flous en attente."""
+        self._executeur.shutdown(wait=False, cancel_futures=True)
 
 class AssetManager:
     """
     Gestionnaire de ressources (Images/Sons) avec cache et sécurité.
     Implémente un système de fallback (placeholder) pour éviter les crashs.
+    Le cache est un LRU borné en octets décodés (un budget pour les images,
+    un pour les sons) ; les ressources de la session en cours sont épinglées.
+    Si un paquet d'assets est fourni, les fichiers y sont lus en priorité ;
+    si un cache pré-décodé est fourni, le décodage mp3/png est évité.
     """
-    def __init__(self) -> None:
-        self._images: Dict[str, pygame.Surface] = {}
-        self._sons: Dict[str, pygame.mixer.Sound] = {}
+    def __init__(self, budget_images: int = Config.BUDGET_IMAGES_OCTETS,
+                 budget_sons: int = Config.BUDGET_SONS_OCTETS,
+                 paquet: Optional[AssetPack] = None,
+                 cache_decode: Optional[DecodedCache] = None) -> None:
+        self._paquet = paquet
+        self._cache_decode = cache_decode
+        self._images: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        self._sons: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
         self._manquants: Set[str] = set()
+
+        # Comptabilité mémoire et statistiques, par type de ressource
+        self._budgets: Dict[str, int] = {"images": budget_images, "sons": budget_sons}
+        self._octets: Dict[str, Dict[str, int]] = {"images": {}, "sons": {}}
+        self._epingles: Set[str] = set()
+        self._stats: Dict[str, Dict[str, int]] = {
+            t: {"hits": 0, "misses": 0, "evictions": 0} for t in ("images", "sons")
+        }
         
         # Création du placeholder (Carré blanc avec bordure)
         self._placeholder = pygame.Surface((350, 350))
         self._placeholder.fill(Config.BLANC)
         pygame.draw.rect(self._placeholder, Config.BLEU_ROI, self._placeholder.get_rect(), 8)
 
+    @staticmethod
+    def _cle_image(nom_fichier: str) -> str:
+        return os.path.basename(nom_fichier).lower()
+
+    def _cle_son(self, nom_fichier: str) -> Tuple[str, str]:
+        """Retourne (clé de cache, chemin disque) d'un son."""
+        # Gestion hybride : chemin direct ou assets/sounds/
+        if self._existe(nom_fichier):
+            return nom_fichier.lower(), nom_fichier
+        cle = os.path.basename(nom_fichier).lower()
+        return cle, os.path.join("assets", "sounds", cle)
+
+    def _existe(self, chemin: str) -> bool:
+        """Présence d'un asset : index du cache décodé et du paquet d'abord (sans appel système), puis disque."""
+        return ((self._cache_decode is not None and chemin in self._cache_decode)
+                or (self._paquet is not None and chemin in self._paquet)
+                or os.path.exists(chemin))
+
+    def _source(self, chemin: str):
+        """Fichier virtuel issu du paquet, ou chemin disque à défaut."""
+        if self._paquet is not None and chemin in self._paquet:
+            return self._paquet.ouvrir(chemin)
+        return chemin
+
     def get_image(self, nom_fichier: Optional[str]) -> pygame.Surface:
         """Récupère une image du cache ou la charge depuis le disque."""
         if not nom_fichier:
             return self._placeholder
 
-        cle = os.path.basename(nom_fichier).lower()
+        cle = self._cle_image(nom_fichier)
         if cle in self._images:
+            self._images.move_to_end(cle)
+            self._stats["images"]["hits"] += 1
             return self._images[cle]
 
         chemin = os.path.join("assets", "images", cle)
         try:
-            if os.path.exists(chemin):
-                img = pygame.image.load(chemin).convert_alpha()
-                self._images[cle] = img
+            if self._existe(chemin):
+                self._stats["images"]["misses"] += 1
+                img = self.decoder("images", chemin).convert_alpha()
+                self._stocker("images", self._images, cle, img, img.get_pitch() * img.get_height())
                 return img
             if chemin not in self._manquants:
                 print(f"⚠️ Image absente : {chemin}")
@@ -108,59 +609,214 @@ class AssetManager:
         if not nom_fichier:
             return None
 
-        # Gestion hybride : chemin direct ou assets/sounds/
-        if os.path.exists(nom_fichier):
-            chemin = nom_fichier
-            cle = nom_fichier.lower()
-        else:
-            cle = os.path.basename(nom_fichier).lower()
-            chemin = os.path.join("assets", "sounds", cle)
-
+        cle, chemin = self._cle_son(nom_fichier)
         if cle in self._sons:
+            self._sons.move_to_end(cle)
+            self._stats["sons"]["hits"] += 1
             return self._sons[cle]
 
         try:
-            if os.path.exists(chemin):
-                son = pygame.mixer.Sound(chemin)
-                self._sons[cle] = son
+            if self._existe(chemin):
+                self._stats["sons"]["misses"] += 1
+                son = self.decoder("sons", chemin)
+                self._stocker("sons", self._sons, cle, son, self._taille_son(son))
                 return son
             return None
         except Exception as e:
             print(f"❌ Erreur chargement son {chemin} : {e}")
             return None
 
-    def precharger(self, images: List[str] = None, sons: List[str] = None) -> None:
-        """Pré-charge une liste de ressources et gère la saturation du cache."""
-        # Sécurité RAM : Nettoyage si le cache devient trop gros
-        if len(self._images) > 200 or len(self._sons) > 200:
-            self.nettoyer_cache()
+    @staticmethod
+    def _taille_son(son: pygame.mixer.Sound) -> int:
+        """Taille du tampon PCM décodé, déduite de la durée et du format du mixer."""
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequence, fmt, canaux = init
+        return int(son.get_length() * frequence * canaux * (abs(fmt) // 8))
+
+    def a_charger(self, images: List[str] = None, sons: List[str] = None) -> List[Tuple[str, str, str]]:
+        """Liste (type, clé, chemin) des ressources présentes sur disque mais absentes du cache."""
+        travaux, vus = [], set()
+        for nom in images or []:
+            cle = self._cle_image(nom)
+            chemin = os.path.join("assets", "images", cle)
+            if cle not in self._images and cle not in vus and self._existe(chemin):
+                travaux.append(("images", cle, chemin))
+                vus.add(cle)
+        for nom in sons or []:
+            cle, chemin = self._cle_son(nom)
+            if cle not in self._sons and cle not in vus and self._existe(chemin):
+                travaux.append(("sons", cle, chemin))
+                vus.add(cle)
+        return travaux
+
+    def decoder(self, type_res: str, chemin: str):
+        """Décode une ressource du paquet ou du disque (appelable depuis un thread de travail)."""
+        if self._cache_decode is not None:
+            valeur = self._cache_decode.charger(type_res, chemin)
+            if valeur is not None:
+                return valeur
+        if type_res == "images":
+            return pygame.image.load(self._source(chemin), os.path.basename(chemin))
+        return pygame.mixer.Sound(self._source(chemin))
+
+    def inserer(self, type_res: str, cle: str, valeur) -> None:
+        """Range dans le cache une ressource décodée ailleurs (thread principal uniquement)."""
+        if type_res == "images":
+            img = valeur.convert_alpha()
+            self._stocker("images", self._images, cle, img, img.get_pitch() * img.get_height())
+        else:
+            self._stocker("sons", self._sons, cle, valeur, self._taille_son(valeur))
+
+    def _stocker(self, type_res: str, cache: OrderedDict, cle: str, valeur, taille: int) -> None:
+        """Ajoute une ressource puis évince les moins récentes tant que le budget est dépassé."""
+        cache[cle] = valeur
+        self._octets[type_res][cle] = taille
+
+        octets = self._octets[type_res]
+        total = sum(octets.values())
+        if total <= self._budgets[type_res]:
+            return
+        for ancienne in list(cache.keys()):
+            if total <= self._budgets[type_res]:
+                break
+            # Jamais la ressource qu'on vient de charger, ni celles de la session
+            if ancienne == cle or ancienne in self._epingles:
+                continue
+            del cache[ancienne]
+            total -= octets.pop(ancienne)
+            self._stats[type_res]["evictions"] += 1
+
+    def epingler(self, images: List[str] = None, sons: List[str] = None) -> None:
+        """Protège de l'éviction les ressources de la session (remplace l'épinglage précédent)."""
+        self._epingles = {self._cle_image(i) for i in images or []}
+        self._epingles |= {self._cle_son(s)[0] for s in sons or []}
 
+    def precharger(self, images: List[str] = None, sons: List[str] = None) -> None:
+        """Pré-charge une liste de ressources (le budget mémoire est géré par le LRU)."""
         if images:
             for img in images: self.get_image(img)
         if sons:
             for s in sons: self.get_son(s)
-        print(f"📦 Assets en cache : {len(self._images)} images, {len(self._sons)} sons.")
+        stats = self.statistiques()
+        print(f"📦 Assets en cache : {len(self._images)} images ({stats['images']['octets'] / 1e6:.1f} Mo), "
+              f"{len(self._sons)} sons ({stats['sons']['octets'] / 1e6:.1f} Mo).")
+
+    def statistiques(self) -> Dict[str, Dict[str, int]]:
+        """Hits, misses, évictions et occupation mémoire de chaque cache."""
+        return {
+            t: dict(self._stats[t], octets=sum(self._octets[t].values()),
+                    budget=self._budgets[t], entrees=len(self._octets[t]))
+            for t in ("images", "sons")
+        }
 
     def nettoyer_cache(self) -> None:
         """Vide le cache manuellement pour libérer de la mémoire."""
         self._images.clear()
         self._sons.clear()
+        for octets in self._octets.values():
+            octets.clear()
         print("🧹 Mémoire libérée (Cache vidé).")
 
+    def fermer(self) -> None:
+        """Libère la projection mémoire et le fichier du paquet d'assets."""
+        if self._paquet is not None:
+            self._paquet.fermer()
+            self._paquet = None
+
+class AssetLoader:
+    """
+    Pré-charge tout le catalogue (lettres et chiffres) pendant le splash.
+    Le catalogue est lu puis les fichiers sont décodés dans un pool de threads ;
+    le thread principal ne fait que ranger les résultats dans l'AssetManager
+    (pomper), ce qui donne une progression réelle pour la barre du splash.
+    """
+    def __init__(self, assets: AssetManager, db: DBManager, threads: int = Config.CHARGEUR_THREADS) -> None:
+        self.assets = assets
+        self.db = db
+        self._executeur = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="assets")
+        self._catalogue: Optional[Future] = None
+        self._travaux: List[Tuple[str, str, Future]] = []
+        self._total: int = 0
+        self._ranges: int = 0
+
+    def demarrer(self) -> None:
+        """Lance la lecture du catalogue en tâche de fond."""
+        self._catalogue = self._executeur.submit(self.db.get_educational_content)
+        self._catalogue.add_done_callback(self._reveiller)
+
+    @staticmethod
+    def _reveiller(_: Future) -> None:
+        """Réveille la boucle principale, qui peut dormir dans event.wait."""
+        pygame.event.post(pygame.event.Event(EVENEMENT_ASSET_PRET))
+
+    def pomper(self) -> None:
+        """Planifie les décodages dès que le catalogue est là et range ceux qui sont terminés."""
+        if self._catalogue is not None and self._catalogue.done():
+            self._planifier(self._catalogue)
+            self._catalogue = None
+
+        restants = []
+        for type_res, cle, travail in self._travaux:
+            if not travail.done():
+                restants.append((type_res, cle, travail))
+                continue
+            try:
+                self.assets.inserer(type_res, cle, travail.result())
+            except Exception as e:
+                print(f"❌ Erreur pré-chargement {cle} : {e}")
+            self._ranges += 1
+        self._travaux = restants
+
+    def _planifier(self, catalogue: Future) -> None:
+        try:
+            contenu = catalogue.result() or []
+        except Exception as e:
+            print(f"⚠️ Catalogue indisponible pour le pré-chargement : {e}")
+            contenu = []
+
+        images = [d.get("image_url") for d in contenu if d.get("image_url")]
+        sons = [d.get("sound_url") for d in contenu if d.get("sound_url")]
+        for type_res, cle, chemin in self.assets.a_charger(images, sons):
+            travail = self._executeur.submit(self.assets.decoder, type_res, chemin)
+            travail.add_done_callback(self._reveiller)
+            self._travaux.append((type_res, cle, travail))
+        self._total = len(self._travaux)
+        print(f"⏳ Pré-chargement de {self._total} ressources ({len(contenu)} éléments au catalogue)...")
+
+    @property
+    def progression(self) -> float:
+        """Avancement réel entre 0 et 1 (la lecture du catalogue compte pour 10 %)."""
+        if self._catalogue is not None:
+            return 0.0
+        if self._total == 0:
+            return 1.0
+        return 0.1 + 0.9 * self._ranges / self._total
+
+    @property
+    def termine(self) -> bool:
+        return self._catalogue is None and not self._travaux
+
+    def fermer(self) -> None:
+        self._executeur.shutdown(wait=False, cancel_futures=True)
+
 class LogicManager:
     """
     Gère la logique métier, les états du jeu et la progression.
     """
-    def __init__(self, db: DBManager, assets: 'AssetManager') -> None:
+    def __init__(self, db: DBManager, assets: 'AssetManager', chargeur: Optional[AssetLoader] = None) -> None:
         """
         Initialise le gestionnaire de logique.
         
         Args:
             db: Instance de gestion de la base de données.
             assets: Instance de gestion des ressources.
+            chargeur: Pré-chargeur du catalogue ; sans lui, le splash dure DELAI_SPLASH.
         """
         self.db = db
         self.assets = assets
+        self.chargeur = chargeur
         self.etat = GameState.SPLASH
         self.temps_debut_etat = pygame.time.get_ticks()
         
@@ -177,7 +833,7 @@ class LogicManager:
         self.vus_session: Set[str] = set()
         
         # Effets
-        self.confettis: List[ConfettiParticle] = []
+        self.confettis = ConfettiSystem()
         self.bravo_joue: bool = False
 
     def changer_etat(self, nouvel_etat: GameState) -> None:
@@ -205,7 +861,7 @@ class LogicManager:
 
         if not raw_data or len(raw_data) < 1:
             print("🚨 ÉCHEC CRITIQUE : Utilisation du mode secours.")
-            self.db.status = 'critical'
+            self.db.set_status('critical')
             raw_data = [
                 {"content": "A", "word": "Avion", "type": "letter", "image_url": "", "sound_url": ""},
                 {"content": "B", "word": "Ballon", "type": "letter", "image_url": "", "sound_url": ""},
@@ -222,6 +878,7 @@ class LogicManager:
         # Pré-chargement
         sons = [d.get("sound_url") for d in raw_data if d.get("sound_url")]
         imgs = [d.get("image_url") for d in raw_data if d.get("image_url")] if type_demande == "letter" else []
+        self.assets.epingler(imgs, sons)
         self.assets.precharger(imgs, sons)
 
         self.changer_etat(GameState.PLAYING_QUESTION)
@@ -233,8 +890,14 @@ class LogicManager:
         maintenant = pygame.time.get_ticks()
         ecoule = maintenant - self.temps_debut_etat
         
+        if self.chargeur and not self.chargeur.termine:
+            self.chargeur.pomper()
+
         if self.etat == GameState.SPLASH:
-            if ecoule > Config.DELAI_SPLASH:
+            if self.chargeur:
+                if self.chargeur.termine or ecoule > Config.DELAI_SPLASH_MAX:
+                    self.changer_etat(GameState.START)
+            elif ecoule > Config.DELAI_SPLASH:
                 self.changer_etat(GameState.START)
 
         elif self.etat == GameState.PLAYING_QUESTION:
@@ -249,6 +912,33 @@ class LogicManager:
         elif self.etat == GameState.CELEBRATION:
             self._animer_confettis()
 
+    def progression_chargement(self) -> float:
+        """Avancement affiché par la barre du splash (réel si un chargeur est actif)."""
+        if self.chargeur:
+            return self.chargeur.progression
+        ecoule = pygame.time.get_ticks() - self.temps_debut_etat
+        return min(ecoule / Config.DELAI_SPLASH, 1.0)
+
+    def est_anime(self) -> bool:
+        """Indique si l'état courant a besoin d'être redessiné en continu."""
+        return self.etat in [GameState.SPLASH, GameState.CELEBRATION]
+
+    def delai_prochain_evenement(self) -> Optional[int]:
+        """
+        Calcule le temps restant avant le prochain timer de l'état courant.
+
+        Returns:
+            Le délai en millisecondes, ou None si aucun timer n'est en attente.
+        """
+        ecoule = pygame.time.get_ticks() - self.temps_debut_etat
+        if self.etat == GameState.SPLASH:
+            delai = Config.DELAI_SPLASH_MAX if self.chargeur else Config.DELAI_SPLASH
+            return max(0, delai - ecoule)
+        if self.etat == GameState.PLAYING_QUESTION:
+            echeance = Config.DELAI_SON if not self.son_joue else Config.DELAI_IMAGE
+            return max(0, echeance - ecoule)
+        return None
+
     def _jouer_son_courant(self) -> None:
         """Joue le son de l'élément actuellement affiché."""
         item = self.donnees_session[self.index_actuel]
@@ -262,91 +952,145 @@ class LogicManager:
             self.vus_session.add(identifiant)
             self.session_decouvertes += 1
             self.total_decouvertes += 1
-            self.db.save_progress(self.total_decouvertes)
+            self.db.record_discovery(identifiant, self.mode_actuel)
 
     def _animer_confettis(self) -> None:
-        """Gère la physique et le cycle de vie des confettis."""
-        if len(self.confettis) < 200:
-            self.confettis.append(ConfettiParticle(random.randint(0, Config.LARGEUR_ECRAN), -20))
-        
-        for p in self.confettis[:]:
-            p.update()
-            if p.y > Config.HAUTEUR_ECRAN + 50:
-                self.confettis.remove(p)
+        """Gère la physique et le cycle de vie des confettis (mise à jour par lot)."""
+        self.confettis.emettre(Config.CONFETTIS_PAR_FRAME, -20, -20)
+        self.confettis.mettre_a_jour()
 
     def lancer_celebration(self) -> None:
         """Initialise la phase de célébration."""
         self.changer_etat(GameState.CELEBRATION)
-        self.confettis = [
-            ConfettiParticle(random.randint(0, Config.LARGEUR_ECRAN), random.randint(-800, 0)) 
-            for _ in range(160)
-        ]
+        self.confettis.reinitialiser()
+        self.confettis.emettre(Config.CONFETTIS_INITIAUX, -800, 0)
 
 class BaseRenderer:
     """Classe de base pour les moteurs de rendu contenant les utilitaires communs."""
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, cache_textes: Optional[TextCache] = None,
+                 polices: Optional[FontRegistry] = None) -> None:
+        self.famille_police: str = "Comic Sans MS"
+        # Cache partageable entre moteurs de rendu (mêmes polices, mêmes libellés)
+        self.cache_textes = cache_textes if cache_textes is not None else TextCache()
+        self.polices = polices if polices is not None else FontRegistry.partage()
+        self.reconfigurer(screen)
+
+    def reconfigurer(self, screen: pygame.Surface) -> None:
+        """
+        Adopte une nouvelle surface de rendu (résolution interne variable).
+        Les positions sont relatives à la taille de la surface et les tailles en
+        pixels sont mises à l'échelle par rapport à la résolution de référence.
+        """
         self.screen = screen
+        self.largeur, self.hauteur = screen.get_size()
+        self.echelle: float = self.hauteur / Config.HAUTEUR_ECRAN
         self._configurer_polices()
 
+    def _px(self, valeur: float) -> int:
+        """Convertit une taille pensée pour 1920x1080 vers la résolution courante."""
+        return round(valeur * self.echelle)
+
     def _configurer_polices(self) -> None:
         """Prépare les polices de caractères adaptées à la résolution."""
-        h = Config.HAUTEUR_ECRAN
+        h = self.hauteur
+        police = self.polices.obtenir
         try:
-            self.font_geante = pygame.font.SysFont("Comic Sans MS", int(h * 0.7))
-            self.font_titre = pygame.font.SysFont("Comic Sans MS", int(h * 0.4))
-            self.font_moyenne = pygame.font.SysFont("Comic Sans MS", int(h * 0.12))
-            self.font_petite = pygame.font.SysFont("Comic Sans MS", int(h * 0.05))
-        except:
-            self.font_geante = pygame.font.SysFont("Arial", int(h * 0.5))
-            self.font_titre = pygame.font.SysFont("Arial", int(h * 0.3))
-            self.font_moyenne = pygame.font.SysFont("Arial", int(h * 0.10))
-            self.font_petite = pygame.font.SysFont("Arial", int(h * 0.04))
+            self.font_geante = police("Comic Sans MS", int(h * 0.7), stricte=True)
+            self.font_titre = police("Comic Sans MS", int(h * 0.4), stricte=True)
+            self.font_moyenne = police("Comic Sans MS", int(h * 0.12), stricte=True)
+            self.font_petite = police("Comic Sans MS", int(h * 0.05), stricte=True)
+            self.font_victoire = police("Comic Sans MS", int(h * 0.38), stricte=True)
+        except FileNotFoundError:
+            self.famille_police = "Arial"
+            self.font_geante = police("Arial", int(h * 0.5))
+            self.font_titre = police("Arial", int(h * 0.3))
+            self.font_moyenne = police("Arial", int(h * 0.10))
+            self.font_petite = police("Arial", int(h * 0.04))
+            self.font_victoire = police("Arial", int(h * 0.3))
 
     def _dessiner_texte(self, texte: str, font: pygame.font.Font, couleur: Tuple, 
-                        centre: Tuple, contour: Optional[Tuple] = None, epaisseur: int = 5) -> None:
-        """Affiche un texte avec un contour optionnel."""
-        if contour:
-            for dx, dy in [(-1,-1), (-1,1), (1,-1), (1,1), (0,-1), (0,1), (-1,0), (1,0)]:
-                s = font.render(str(texte), True, contour)
-                r = s.get_rect(center=(centre[0] + dx * epaisseur, centre[1] + dy * epaisseur))
-                self.screen.blit(s, r)
-        s = font.render(str(texte), True, couleur)
+                        centre: Tuple, contour: Optional[Tuple] = None, epaisseur: int = 5) -> pygame.Rect:
+        """Affiche un texte avec un contour optionnel (un seul blit grâce au cache)."""
+        s = self.cache_textes.obtenir(str(texte), font, couleur, contour, epaisseur)
         r = s.get_rect(center=centre)
-        self.screen.blit(s, r)
+        return self.screen.blit(s, r)
+
+    def _restaurer_fond(self, fond: pygame.Surface, zones: List[pygame.Rect]) -> None:
+        """Recopie l'arrière-plan sous chaque zone avant de la redessiner."""
+        for zone in zones:
+            self.screen.blit(fond, zone, zone)
+
+    def _clipper(self, zones: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Ramène les zones dans l'écran et écarte celles qui en sortent complètement."""
+        ecran = self.screen.get_rect()
+        return [z for z in (zone.clip(ecran) for zone in zones) if z.width and z.height]
 
 class MenuRenderer(BaseRenderer):
     """
     Gère le rendu visuel des écrans de démarrage et de menu.
     """
-    def __init__(self, screen: pygame.Surface) -> None:
-        super().__init__(screen)
+    COULEURS_TITRE = [(230,80,150), (255,160,60), (160,100,200), (80,180,230), (255,210,50), (144,238,144)]
+
+    def __init__(self, screen: pygame.Surface, cache_textes: Optional[TextCache] = None,
+                 cache_scenes: Optional[SceneCache] = None) -> None:
+        super().__init__(screen, cache_textes)
+        self.cache_scenes = cache_scenes if cache_scenes is not None else SceneCache()
+
+    def reconfigurer(self, screen: pygame.Surface) -> None:
+        super().reconfigurer(screen)
         self._titre_cache = None
+        self._largeur_barre_affichee: int = -1
 
-    def dessiner_splash(self, temps_debut: int) -> None:
+    def dessiner_splash(self, progression: float) -> None:
         """Affiche l'écran de chargement animé."""
         if not self._titre_cache:
-            self._titre_cache = self._generer_titre_stylise("Charlène")
+            titre = "Charlène"
+            parametres = (titre, self.famille_police, self.font_titre.get_height(), tuple(self.COULEURS_TITRE))
+            self._titre_cache = self.cache_scenes.obtenir(
+                "titre", parametres, lambda: self._generer_titre_stylise(titre))
         
-        r = self._titre_cache.get_rect(center=(Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN // 2 - 80))
+        r = self._titre_cache.get_rect(center=(self.largeur // 2, self.hauteur // 2 - self._px(80)))
         self.screen.blit(self._titre_cache, r)
         
         self._dessiner_texte("Chargement...", self.font_petite, Config.GRIS_TEXTE, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.78))
-        self._afficher_barre_chargement(temps_debut)
+                            (self.largeur // 2, self.hauteur * 0.78))
+        self._afficher_barre_chargement(progression)
 
-    def _afficher_barre_chargement(self, temps_debut: int) -> None:
+    def _afficher_barre_chargement(self, progression: float) -> pygame.Rect:
         """Dessine la barre de progression du splash."""
-        prog = min((pygame.time.get_ticks() - temps_debut) / Config.DELAI_SPLASH, 1.0)
-        bw, bh = 800, 45
-        bx, by = (Config.LARGEUR_ECRAN - bw) // 2, Config.HAUTEUR_ECRAN * 0.85
-        pygame.draw.rect(self.screen, Config.BLANC, (bx, by, bw, bh), 5, border_radius=22)
-        if prog > 0.02:
-            pygame.draw.rect(self.screen, Config.BLANC, (bx + 10, by + 10, (bw - 20) * prog, bh - 20), border_radius=15)
+        prog = min(progression, 1.0)
+        bw, bh, marge = self._px(800), self._px(45), self._px(10)
+        bx, by = (self.largeur - bw) // 2, self.hauteur * 0.85
+        cadre = pygame.draw.rect(self.screen, Config.BLANC, (bx, by, bw, bh), self._px(5), border_radius=self._px(22))
+        self._largeur_barre_affichee = int((bw - 2 * marge) * prog) if prog > 0.02 else 0
+        if self._largeur_barre_affichee:
+            pygame.draw.rect(self.screen, Config.BLANC,
+                             (bx + marge, by + marge, self._largeur_barre_affichee, bh - 2 * marge),
+                             border_radius=self._px(15))
+        return cadre
+
+    def actualiser_barre(self, fond: pygame.Surface, progression: float) -> List[pygame.Rect]:
+        """
+        Redessine uniquement la barre de progression si elle a avancé.
+
+        Returns:
+            Les zones d'écran modifiées (vide si rien n'a bougé).
+        """
+        avant = self._largeur_barre_affichee
+        bw, bh, marge = self._px(800), self._px(45), self._px(10)
+        zone = pygame.Rect((self.largeur - bw) // 2, int(self.hauteur * 0.85), bw, bh + 1)
+        prog = min(progression, 1.0)
+        if (int((bw - 2 * marge) * prog) if prog > 0.02 else 0) == avant:
+            return []
+
+        self._restaurer_fond(fond, [zone])
+        self._afficher_barre_chargement(progression)
+        return [zone]
 
     def dessiner_menu(self, total_decouvertes: int, db_status: str) -> None:
         """Affiche le menu principal et les statistiques."""
         self._dessiner_texte("Menu Charlène", self.font_moyenne, Config.BLEU_ROI, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.2))
+                            (self.largeur // 2, self.hauteur * 0.2))
         self._afficher_options_menu()
         self._afficher_stats(total_decouvertes)
         self._afficher_alerte_db(db_status)
@@ -356,44 +1100,57 @@ class MenuRenderer(BaseRenderer):
         options = [("1 - Alphabet", (100, 100, 200), 0.45), ("2 - Chiffres", (200, 100, 100), 0.6)]
         for texte, couleur, y_ratio in options:
             self._dessiner_texte(texte, self.font_moyenne, couleur, 
-                                (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * y_ratio))
+                                (self.largeur // 2, self.hauteur * y_ratio))
 
     def _afficher_stats(self, total: int) -> None:
         """Affiche le compteur de savoirs récoltés."""
         txt = f"Savoirs récoltés : {total}"
         self._dessiner_texte(txt, self.font_petite, Config.BLEU_ROI, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.85))
+                            (self.largeur // 2, self.hauteur * 0.85))
 
     def _afficher_alerte_db(self, status: str) -> None:
-        """Affiche un indicateur visuel si la DB est hors-ligne."""
-        if status in ['offline', 'critical']:
-            m = "Mode Secours 🚩" if status == 'offline' else "Mode Secours Critique 🚨"
-            c = (170, 0, 0) if status == 'offline' else Config.ROUGE_ALERTE
-            surf = self.font_petite.render(m, True, c)
-            self.screen.blit(surf, (Config.LARGEUR_ECRAN - surf.get_width() - 30, Config.HAUTEUR_ECRAN - surf.get_height() - 30))
+        """Affiche un indicateur visuel si la DB est hors-ligne ou encore en connexion."""
+        if status in ['connecting', 'offline', 'critical']:
+            m = {"connecting": "Connexion…", "offline": "Mode Secours 🚩"}.get(status, "Mode Secours Critique 🚨")
+            c = {"connecting": Config.BLANC, "offline": (170, 0, 0)}.get(status, Config.ROUGE_ALERTE)
+            surf = self.cache_textes.obtenir(m, self.font_petite, c)
+            self.screen.blit(surf, (self.largeur - surf.get_width() - self._px(30),
+                                    self.hauteur - surf.get_height() - self._px(30)))
 
     def _generer_titre_stylise(self, texte: str) -> pygame.Surface:
         """Crée une surface de titre avec des couleurs vives et un effet sticker."""
-        couleurs = [(230,80,150), (255,160,60), (160,100,200), (80,180,230), (255,210,50), (144,238,144)]
+        couleurs = self.COULEURS_TITRE
         lettres = [self.font_titre.render(c, True, couleurs[i % len(couleurs)]) for i, c in enumerate(texte)]
-        l_totale = sum(l.get_width() - 20 for l in lettres)
+        chevauchement, bord = self._px(20), self._px(25)
+        l_totale = sum(l.get_width() - chevauchement for l in lettres)
         h_max = max(l.get_height() for l in lettres)
         
-        surf = pygame.Surface((l_totale + 50, h_max + 50), pygame.SRCALPHA)
-        x = 25
+        surf = pygame.Surface((l_totale + 2 * bord, h_max + 2 * bord), pygame.SRCALPHA)
+        x = bord
         for i, l in enumerate(lettres):
             char = texte[i]
             for dx, dy in [(-5,-5), (5,-5), (-5,5), (5,5), (0,-7), (0,7), (-7,0), (7,0)]:
                 sticker = self.font_titre.render(char, True, Config.BLANC)
-                surf.blit(sticker, (x + dx, 25 + dy))
-            surf.blit(l, (x, 25))
-            x += l.get_width() - 20
+                surf.blit(sticker, (x + self._px(dx), bord + self._px(dy)))
+            surf.blit(l, (x, bord))
+            x += l.get_width() - chevauchement
         return surf
 
 class GameRenderer(BaseRenderer):
     """
     Gère le rendu visuel des phases de jeu et de célébration.
     """
+    def reconfigurer(self, screen: pygame.Surface) -> None:
+        super().reconfigurer(screen)
+        self._atlas = ConfettiAtlas(self.echelle)
+        self._zones_confettis: List[pygame.Rect] = []
+
+        # Bandeau semi-transparent de l'indice (créé une fois par résolution)
+        self._hauteur_bandeau = int(self.hauteur * 0.13)
+        self._bandeau = pygame.Surface((self.largeur, self._hauteur_bandeau))
+        self._bandeau.fill(Config.NOIR)
+        self._bandeau.set_alpha(150)
+
     def dessiner_jeu(self, item: Dict, etat: GameState) -> None:
         """Affiche l'élément éducatif et l'indice si nécessaire."""
         self._afficher_lettre_centrale(item.get("content", "?"))
@@ -403,32 +1160,216 @@ class GameRenderer(BaseRenderer):
     def _afficher_lettre_centrale(self, contenu: str) -> None:
         """Affiche le caractère principal au centre de l'écran."""
         self._dessiner_texte(contenu, self.font_geante, Config.NOIR, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN // 2), 
-                            contour=Config.BLANC, epaisseur=8)
+                            (self.largeur // 2, self.hauteur // 2), 
+                            contour=Config.BLANC, epaisseur=self._px(8))
 
     def _afficher_bandeau_indice(self, mot: str) -> None:
         """Affiche le mot associé au caractère en bas de l'écran."""
-        bh = int(Config.HAUTEUR_ECRAN * 0.13)
-        bandeau = pygame.Surface((Config.LARGEUR_ECRAN, bh))
-        bandeau.fill(Config.NOIR)
-        bandeau.set_alpha(150)
-        self.screen.blit(bandeau, (0, Config.HAUTEUR_ECRAN - bh))
+        bh = self._hauteur_bandeau
+        self.screen.blit(self._bandeau, (0, self.hauteur - bh))
         self._dessiner_texte(mot, self.font_moyenne, Config.BLANC, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN - (bh // 2)))
+                            (self.largeur // 2, self.hauteur - (bh // 2)))
 
-    def dessiner_victoire(self, confettis: List[ConfettiParticle], decouvertes: int) -> None:
+    def dessiner_victoire(self, confettis: ConfettiSystem, decouvertes: int) -> None:
         """Affiche l'écran de célébration final."""
-        for p in confettis: p.draw(self.screen)
-        
-        f_win = pygame.font.SysFont("Comic Sans MS", int(Config.HAUTEUR_ECRAN * 0.38))
-        self._dessiner_texte("BRAVO !", f_win, (255, 0, 100), (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.38))
-        
-        txt = f"+{decouvertes} savoirs découverts !"
-        self._dessiner_texte(txt, self.font_moyenne, Config.BLEU_ROI, 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.76))
-        
-        self._dessiner_texte("Appuie sur ESPACE", self.font_petite, (120, 120, 120), 
-                            (Config.LARGEUR_ECRAN // 2, Config.HAUTEUR_ECRAN * 0.94))
+        self._zones_confettis = self._dessiner_confettis(confettis)
+        for texte, font, couleur, centre in self._libelles_victoire(decouvertes):
+            self._dessiner_texte(texte, font, couleur, centre)
+
+    def actualiser_victoire(self, fond: pygame.Surface, confettis: ConfettiSystem,
+                            decouvertes: int) -> List[pygame.Rect]:
+        """
+        Redessine seulement ce que les confettis ont touché depuis la frame précédente.
+
+        Returns:
+            Les zones d'écran modifiées (anciennes et nouvelles positions, libellés recouverts).
+        """
+        sprites = self._sprites_confettis(confettis)
+        nouvelles = self._clipper([pygame.Rect(pos, s.get_size()) for s, pos in sprites])
+        zones = self._zones_confettis + nouvelles
+
+        # Un libellé touché par un confetti est repeint en entier par-dessus
+        libelles = []
+        for texte, font, couleur, centre in self._libelles_victoire(decouvertes):
+            rect = self.cache_textes.obtenir(texte, font, couleur).get_rect(center=centre)
+            if zones and rect.collidelist(zones) != -1:
+                libelles.append((texte, font, couleur, centre))
+                zones.append(rect)
+
+        self._restaurer_fond(fond, zones)
+        self.screen.blits(sprites, doreturn=False)
+        for texte, font, couleur, centre in libelles:
+            self._dessiner_texte(texte, font, couleur, centre)
+
+        self._zones_confettis = nouvelles
+        return zones
+
+    def _libelles_victoire(self, decouvertes: int) -> List[Tuple]:
+        """Textes fixes de l'écran de victoire : (texte, police, couleur, centre)."""
+        return [
+            ("BRAVO !", self.font_victoire, (255, 0, 100),
+             (self.largeur // 2, self.hauteur * 0.38)),
+            (f"+{decouvertes} savoirs découverts !", self.font_moyenne, Config.BLEU_ROI,
+             (self.largeur // 2, self.hauteur * 0.76)),
+            ("Appuie sur ESPACE", self.font_petite, (120, 120, 120),
+             (self.largeur // 2, self.hauteur * 0.94)),
+        ]
+
+    def _sprites_confettis(self, confettis: ConfettiSystem) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Associe chaque particule vivante à son sprite pré-tourné de l'atlas."""
+        xs, ys, tailles, angles, couleurs = confettis.particules_actives()
+        if self.echelle != 1.0:
+            # La simulation reste en coordonnées 1920x1080
+            xs = (xs * self.echelle).astype(np.int32)
+            ys = (ys * self.echelle).astype(np.int32)
+        cles = self._atlas.cles(tailles, angles, couleurs)
+        sprite = self._atlas.sprite
+        return [(sprite(c), (x, y)) for c, x, y in zip(cles.tolist(), xs.tolist(), ys.tolist())]
+
+    def _dessiner_confettis(self, confettis: ConfettiSystem) -> List[pygame.Rect]:
+        """Dessine les particules vivantes et retourne les zones touchées."""
+        sprites = self._sprites_confettis(confettis)
+        self.screen.blits(sprites, doreturn=False)
+        return self._clipper([pygame.Rect(pos, s.get_size()) for s, pos in sprites])
+
+class RenderGovernor:
+    """
+    Gouverneur du budget de frame.
+    Observe le temps de travail des frames animées et choisit un palier de
+    résolution interne (100 / 75 / 50 %) et de densité de confettis :
+    il descend d'un palier quand le p95 dépasse le budget et remonte quand
+    la marge est large. Chaque décision repart d'une fenêtre vide.
+    """
+    PALIERS = [1.0, 0.75, 0.5]
+    FACTEURS_CONFETTIS = [1.0, 0.6, 0.35]
+
+    def __init__(self, budget_ms: float = Config.BUDGET_FRAME_MS, fenetre: int = Config.GOUVERNEUR_FENETRE) -> None:
+        self.budget_ms: float = budget_ms
+        self.fenetre: int = fenetre
+        self.palier: int = 0
+        self._durees: List[float] = []
+
+    @property
+    def echelle(self) -> float:
+        return self.PALIERS[self.palier]
+
+    @property
+    def limite_confettis(self) -> int:
+        return int(Config.CONFETTIS_MAX * self.FACTEURS_CONFETTIS[self.palier])
+
+    def enregistrer(self, duree_ms: float) -> bool:
+        """
+        Ajoute la durée d'une frame animée.
+
+        Returns:
+            True si le palier a changé (l'appelant doit reconfigurer le rendu).
+        """
+        self._durees.append(duree_ms)
+        if len(self._durees) < self.fenetre:
+            return False
+
+        durees = sorted(self._durees)
+        p95 = durees[min(len(durees) - 1, int(len(durees) * 0.95))]
+        self._durees.clear()
+        if p95 > self.budget_ms and self.palier < len(self.PALIERS) - 1:
+            self.palier += 1
+        elif p95 < self.budget_ms * Config.GOUVERNEUR_MARGE and self.palier > 0:
+            self.palier -= 1
+        else:
+            return False
+        print(f"🎚️ Rendu à {int(self.echelle * 100)} % (p95 = {p95:.1f} ms), "
+              f"{self.limite_confettis} confettis max.")
+        return True
+
+class FrameProfiler:
+    """
+    Chronomètre chaque étape de la boucle (entrées, logique, dessin, présentation)
+    et chaque méthode de rendu, sur une fenêtre glissante.
+    Le HUD (F3) affiche p50 / p95 / max ; pendant qu'il est visible, chaque mesure
+    est aussi ajoutée à une trace exportée en CSV à la fermeture du jeu.
+    """
+    ETAPES = ["entrees", "logique", "dessin", "presentation"]
+
+    def __init__(self, fenetre: int = Config.PROFILEUR_FENETRE) -> None:
+        self.actif: bool = False
+        self.fenetre: int = fenetre
+        self._mesures: Dict[str, deque] = {}
+        self._frame: List[Tuple[str, float]] = []
+        self._trace: List[Tuple[int, float, str, str, float]] = []
+        self._numero_frame: int = 0
+        self._debut = time.perf_counter()
+        self._police: Optional[pygame.font.Font] = None
+
+    def basculer(self) -> None:
+        self.actif = not self.actif
+        print(f"📈 Profileur {'affiché' if self.actif else 'masqué'}.")
+
+    @contextmanager
+    def mesurer(self, nom: str):
+        """Chronomètre le bloc et range la durée (ms) sous `nom`."""
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            duree = (time.perf_counter() - debut) * 1000
+            self._mesures.setdefault(nom, deque(maxlen=self.fenetre)).append(duree)
+            self._frame.append((nom, duree))
+
+    def fin_frame(self, etat: GameState) -> None:
+        """Clôt la frame : ses mesures rejoignent la trace si le HUD est visible."""
+        self._numero_frame += 1
+        if self.actif and len(self._trace) < Config.PROFILEUR_TRACE_MAX:
+            t = (time.perf_counter() - self._debut) * 1000
+            for nom, duree in self._frame:
+                self._trace.append((self._numero_frame, round(t, 3), etat.name, nom, round(duree, 4)))
+        self._frame = []
+
+    def resume(self, nom: str) -> Tuple[float, float, float]:
+        """Retourne (p50, p95, max) en millisecondes sur la fenêtre glissante."""
+        valeurs = sorted(self._mesures.get(nom, ()))
+        if not valeurs:
+            return 0.0, 0.0, 0.0
+        rang = lambda p: valeurs[min(len(valeurs) - 1, int(len(valeurs) * p))]
+        return rang(0.50), rang(0.95), valeurs[-1]
+
+    def dessiner_hud(self, screen: pygame.Surface) -> None:
+        """Affiche le tableau des mesures en haut à gauche de l'écran."""
+        if self._police is None:
+            self._police = FontRegistry.partage().obtenir("Consolas", 24)
+        noms = self.ETAPES + sorted(n for n in self._mesures if n not in self.ETAPES)
+        lignes = [f"{'étape':<20}{'p50':>8}{'p95':>8}{'max':>8}  ms"]
+        for nom in noms:
+            p50, p95, maxi = self.resume(nom)
+            lignes.append(f"{nom:<20}{p50:>8.2f}{p95:>8.2f}{maxi:>8.2f}")
+
+        rendus = [self._police.render(ligne, True, Config.BLANC) for ligne in lignes]
+        hauteur = sum(r.get_height() for r in rendus) + 20
+        largeur = max(r.get_width() for r in rendus) + 20
+        panneau = pygame.Surface((largeur, hauteur))
+        panneau.fill(Config.NOIR)
+        panneau.set_alpha(180)
+        screen.blit(panneau, (10, 10))
+        y = 20
+        for rendu in rendus:
+            screen.blit(rendu, (20, y))
+            y += rendu.get_height()
+
+    def exporter_csv(self, dossier: str = Config.DOSSIER_LOGS) -> Optional[str]:
+        """Écrit la trace collectée ; retourne le chemin du fichier (None si trace vide)."""
+        if not self._trace:
+            return None
+        try:
+            os.makedirs(dossier, exist_ok=True)
+            chemin = os.path.join(dossier, time.strftime("profil_frames_%Y%m%d_%H%M%S.csv"))
+            with open(chemin, "w", newline="", encoding="utf-8") as f:
+                ecrivain = csv.writer(f)
+                ecrivain.writerow(["frame", "temps_ms", "etat", "etape", "duree_ms"])
+                ecrivain.writerows(self._trace)
+            print(f"📈 Trace du profileur exportée : {chemin} ({len(self._trace)} mesures).")
+            return chemin
+        except Exception as e:
+            print(f"❌ Export de la trace du profileur impossible : {e}")
+            return None
 
 class GameApp:
     """
@@ -440,71 +1381,147 @@ class GameApp:
         pygame.init()
         pygame.mixer.init()
         
-        self.screen = pygame.display.set_mode(
+        self.fenetre = pygame.display.set_mode(
             (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN),
             pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.NOFRAME
         )
+        # Surface de rendu : la fenêtre elle-même à 100 %, sinon une surface réduite
+        self.screen = self.fenetre
         pygame.display.set_caption("Alphabet Kids - Prototype V1")
 
         # Initialisation composants
-        self.assets = AssetManager()
-        self.db = DBManager()
+        self.assets = AssetManager(paquet=AssetPack.ouvrir_si_present(Config.FICHIER_PAQUET),
+                                   cache_decode=DecodedCache.ouvrir_si_present())
+        # Connexion Supabase en tâche de fond : le jeu démarre aussitôt (cache / hors-ligne)
+        self.db = DBManager(background=True, on_status_change=self._signaler_statut_db)
         self.clock = pygame.time.Clock()
         
-        # Managers
-        self.logic = LogicManager(self.db, self.assets)
-        self.menu_renderer = MenuRenderer(self.screen)
-        self.game_renderer = GameRenderer(self.screen)
+        # Managers (le catalogue se charge pendant que le splash s'affiche)
+        self.chargeur = AssetLoader(self.assets, self.db)
+        self.chargeur.demarrer()
+        self.logic = LogicManager(self.db, self.assets, self.chargeur)
+        self.cache_textes = TextCache()
+        self.cache_scenes = SceneCache()
+        self.menu_renderer = MenuRenderer(self.screen, self.cache_textes, self.cache_scenes)
+        self.game_renderer = GameRenderer(self.screen, self.cache_textes)
 
         # Cache d'arrière-plan
-        self.fond_degrade = pygame.Surface((Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
-        self._creer_degrade_vertical(self.fond_degrade, Config.BLEU_CIEL, Config.ROSE_PASTEL)
+        self.fond_degrade = self.cache_scenes.obtenir(
+            "degrade", (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN, Config.BLEU_CIEL, Config.ROSE_PASTEL),
+            self._generer_fond_degrade)
         self.fond_jeu_actuel: Optional[pygame.Surface] = None
+        self.preparateur_fonds = BackgroundPreparer()
+        self._fond_attendu: Optional[str] = None
+
+        # Rendu par zones : signature de la dernière scène entièrement présentée
+        self._signature_affichee: Optional[Tuple] = None
+        self.profileur = FrameProfiler()
+
+        # Résolution interne pilotée par le budget de frame
+        self.gouverneur = RenderGovernor()
+        self._echelle: float = 1.0
+        # Seul le couple (fond d'origine, version réduite) courant est gardé
+        self._fond_reduit: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
         
         # Audio
         self.son_bravo = self.assets.get_son("assets/sounds/effects/fireworks.mp3")
         self.en_cours: bool = True
 
+    @staticmethod
+    def _signaler_statut_db(_: str) -> None:
+        """Réveille la boucle : le changement de status modifie la signature et redessine le menu."""
+        pygame.event.post(pygame.event.Event(EVENEMENT_STATUT_DB))
+
+    def _generer_fond_degrade(self) -> pygame.Surface:
+        """Produit l'arrière-plan dégradé plein écran (appelé si le cache disque est froid)."""
+        fond = pygame.Surface((Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN)).convert()
+        self._creer_degrade_vertical(fond, Config.BLEU_CIEL, Config.ROSE_PASTEL)
+        return fond
+
     def _creer_degrade_vertical(self, surface: pygame.Surface, haut: Tuple, bas: Tuple) -> None:
-        """Remplit une surface avec un dégradé de couleurs vertical."""
+        """Remplit une surface avec un dégradé de couleurs vertical (calcul vectorisé)."""
         h, w = surface.get_height(), surface.get_width()
-        for y in range(h):
-            r = haut[0] + (bas[0] - haut[0]) * y / h
-            g = haut[1] + (bas[1] - haut[1]) * y / h
-            b = haut[2] + (bas[2] - haut[2]) * y / h
-            pygame.draw.line(surface, (int(r), int(g), int(b)), (0, y), (w, y))
+        t = np.arange(h, dtype=np.float64)[:, None] / h
+        lignes = (np.array(haut) + (np.array(bas) - np.array(haut)) * t).astype(np.uint8)
+        # Une couleur par ligne, répétée sur toute la largeur (vue, sans copie)
+        pygame.surfarray.blit_array(surface, np.broadcast_to(lignes[None, :, :], (w, h, 3)))
 
     def _preparer_fond_dynamique(self, image_nom: Optional[str]) -> None:
-        """Crée un arrière-plan thématique flou pour la question actuelle."""
-        if not image_nom or self.logic.mode_actuel != "letter":
+        """
+        Affiche l'arrière-plan thématique flou de la question actuelle.
+        S'il n'est pas encore prêt, le dégradé reste affiché jusqu'à EVENEMENT_FOND_PRET.
+        """
+        self._fond_attendu = None
+        if not self._demander_fond(image_nom):
             self.fond_jeu_actuel = None
             return
 
-        image = self.assets.get_image(image_nom)
-        if not image or image == self.assets._placeholder:
-            self.fond_jeu_actuel = None
-            return
+        self.fond_jeu_actuel = self.preparateur_fonds.obtenir(image_nom)
+        if self.fond_jeu_actuel is None:
+            self._fond_attendu = image_nom
 
-        fond = pygame.transform.smoothscale(image, (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
-        facteur = 12
-        pete = pygame.transform.smoothscale(fond, (Config.LARGEUR_ECRAN // facteur, Config.HAUTEUR_ECRAN // facteur))
-        fond = pygame.transform.smoothscale(pete, (Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
-
-        filtre = pygame.Surface((Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
-        filtre.fill(Config.NOIR)
-        filtre.set_alpha(130)
-        fond.blit(filtre, (0, 0))
-        self.fond_jeu_actuel = fond.convert()
+    def _demander_fond(self, image_nom: Optional[str]) -> bool:
+        """Planifie le flou d'une image ; False si l'élément n'a pas de fond thématique."""
+        if not image_nom or self.logic.mode_actuel != "letter":
+            return False
 
-    def orchestrer_entrees(self) -> None:
+        image = self.assets.get_image(image_nom)
+        if not image or image == self.assets._placeholder:
+            return False
+
+        self.preparateur_fonds.demander(image_nom, image)
+        return True
+
+    def _anticiper_fonds(self) -> None:
+        """Lance le flou des éléments précédent et suivant avant que l'enfant n'y arrive."""
+        for i in (self.logic.index_actuel + 1, self.logic.index_actuel - 1):
+            if 0 <= i < len(self.logic.donnees_session):
+                self._demander_fond(self.logic.donnees_session[i].get("image_url"))
+
+    def _recevoir_fond_pret(self) -> None:
+        """Échange le fond dès que celui de l'élément affiché est prêt."""
+        if self._fond_attendu:
+            fond = self.preparateur_fonds.obtenir(self._fond_attendu)
+            if fond is not None:
+                self.fond_jeu_actuel = fond
+                self._fond_attendu = None
+
+    def _attendre_evenements(self) -> List[pygame.event.Event]:
+        """
+        Cadence la boucle : 60 fps pendant les animations, sinon sommeil bloquant
+        jusqu'au prochain événement clavier ou au prochain timer du jeu.
+        """
+        if not Config.BOUCLE_ECONOME or self.logic.est_anime() or self.profileur.actif:
+            self.clock.tick(Config.FPS)
+            return pygame.event.get()
+
+        delai = self.logic.delai_prochain_evenement()
+        # Un timeout de 0 signifie "attente infinie" pour pygame : on force au moins 1 ms
+        premier = pygame.event.wait(max(1, delai) if delai is not None else 0)
+        evenements = [] if premier.type == pygame.NOEVENT else [premier]
+        evenements.extend(pygame.event.get())
+        self.clock.tick()
+        return evenements
+
+    def orchestrer_entrees(self, evenements: Optional[List[pygame.event.Event]] = None) -> None:
         """Traite les événements pygame et les touches pressées."""
         maintenant = pygame.time.get_ticks()
         ecoule = maintenant - self.logic.temps_debut_etat
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+        if evenements is None:
+            evenements = pygame.event.get()
+
+        for event in evenements:
+            if event.type == EVENEMENT_FOND_PRET:
+                self._recevoir_fond_pret()
+
+            elif event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
                 self.en_cours = False
 
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profileur.basculer()
+                self._signature_affichee = None  # Redessin complet pour afficher / effacer le HUD
+
             elif event.type == pygame.KEYDOWN:
                 if self.logic.etat == GameState.START:
                     if event.key in [pygame.K_1, pygame.K_KP1]:
@@ -546,37 +1563,164 @@ class GameApp:
         if self.logic.etat in [GameState.PLAYING_QUESTION, GameState.PLAYING_HINT]:
             item = self.logic.donnees_session[self.logic.index_actuel]
             self._preparer_fond_dynamique(item.get("image_url"))
+            self._anticiper_fonds()
 
-    def dessiner(self) -> None:
-        """Coordonne le rendu visuel global de l'application."""
-        # 1. Fond
+    def _fond_courant(self) -> pygame.Surface:
+        """Retourne l'arrière-plan de l'état en cours, à la résolution interne."""
         if self.logic.etat in [GameState.SPLASH, GameState.START, GameState.CELEBRATION] or not self.fond_jeu_actuel:
-            self.screen.blit(self.fond_degrade, (0, 0))
+            fond = self.fond_degrade
         else:
-            self.screen.blit(self.fond_jeu_actuel, (0, 0))
+            fond = self.fond_jeu_actuel
+        if self.screen is self.fenetre:
+            return fond
+
+        # Version réduite du fond courant, remplacée dès que le fond change
+        # (l'identité garde la signature stable ; les fonds flous restent bornés par leur LRU)
+        if self._fond_reduit is None or self._fond_reduit[0] is not fond:
+            self._fond_reduit = (fond, pygame.transform.smoothscale(fond, self.screen.get_size()))
+        return self._fond_reduit[1]
+
+    def _synchroniser_echelle(self) -> None:
+        """
+        Applique le palier du gouverneur pendant la célébration seulement :
+        les écrans statiques (menu, questions) sont toujours rendus à 100 %.
+        """
+        anime = Config.RESOLUTION_DYNAMIQUE and self.logic.etat == GameState.CELEBRATION
+        echelle = self.gouverneur.echelle if anime else 1.0
+        if echelle != self._echelle:
+            self._appliquer_echelle(echelle)
+
+    def _appliquer_echelle(self, echelle: float) -> None:
+        """Change la résolution interne : nouvelle surface, polices et atlas adaptés."""
+        self._echelle = echelle
+        if echelle == 1.0:
+            self.screen = self.fenetre
+        else:
+            taille = (int(Config.LARGEUR_ECRAN * echelle), int(Config.HAUTEUR_ECRAN * echelle))
+            self.screen = pygame.Surface(taille).convert()
+        self.menu_renderer.reconfigurer(self.screen)
+        self.game_renderer.reconfigurer(self.screen)
+        self._fond_reduit = None
+        self._signature_affichee = None
+        self.logic.confettis.limite = self.gouverneur.limite_confettis
+
+    def _signature_scene(self, fond: pygame.Surface) -> Tuple:
+        """Résume tout ce qui définit le contenu statique de l'écran."""
+        return (self.logic.etat, self.logic.index_actuel, self.logic.mode_actuel, id(fond),
+                len(self.logic.donnees_session), self.db.status,
+                self.logic.total_decouvertes, self.logic.session_decouvertes)
+
+    def dessiner(self) -> None:
+        """
+        Coordonne le rendu visuel global de l'application.
+        Une scène nouvelle est redessinée en entier ; ensuite seules les zones
+        animées sont repeintes et présentées, et une frame statique n'est pas présentée.
+        Quand le HUD du profileur est visible, chaque frame est redessinée en entier.
+        """
+        self._synchroniser_echelle()
+        with self.profileur.mesurer("dessin"):
+            fond = self._fond_courant()
+            signature = self._signature_scene(fond)
+            complet = not Config.RENDU_PARTIEL or self.profileur.actif or signature != self._signature_affichee
+            if complet:
+                self._dessiner_scene(fond)
+                self._signature_affichee = signature
+                zones = []
+            else:
+                zones = self._actualiser_zones(fond)
+
+        with self.profileur.mesurer("presentation"):
+            if self.screen is not self.fenetre:
+                # Résolution réduite : agrandissement unique vers la fenêtre
+                if complet or zones:
+                    pygame.transform.smoothscale(self.screen, self.fenetre.get_size(), self.fenetre)
+                    if self.profileur.actif:
+                        self.profileur.dessiner_hud(self.fenetre)
+                    pygame.display.flip()
+                return
+            if self.profileur.actif:
+                self.profileur.dessiner_hud(self.fenetre)
+            if complet or len(zones) > Config.RENDU_PARTIEL_MAX_ZONES:
+                pygame.display.flip()
+            elif zones:
+                pygame.display.update(zones)
+
+    def _dessiner_scene(self, fond: pygame.Surface) -> None:
+        """Redessine l'écran complet : fond puis scène de l'état courant."""
+        # 1. Fond
+        self.screen.blit(fond, (0, 0))
         
-        # 2. Scènes spécifiques
+        # 2. Scènes spécifiques (chaque moteur de rendu est chronométré séparément)
+        mesurer = self.profileur.mesurer
         if self.logic.etat == GameState.SPLASH:
-            self.menu_renderer.dessiner_splash(self.logic.temps_debut_etat)
+            with mesurer("dessiner_splash"):
+                self.menu_renderer.dessiner_splash(self.logic.progression_chargement())
         elif self.logic.etat == GameState.START:
-            self.menu_renderer.dessiner_menu(self.logic.total_decouvertes, self.db.status)
+            with mesurer("dessiner_menu"):
+                self.menu_renderer.dessiner_menu(self.logic.total_decouvertes, self.db.status)
         elif self.logic.etat in [GameState.PLAYING_QUESTION, GameState.PLAYING_HINT]:
-            self.game_renderer.dessiner_jeu(self.logic.donnees_session[self.logic.index_actuel], self.logic.etat)
+            with mesurer("dessiner_jeu"):
+                self.game_renderer.dessiner_jeu(self.logic.donnees_session[self.logic.index_actuel], self.logic.etat)
         elif self.logic.etat == GameState.CELEBRATION:
-            self.game_renderer.dessiner_victoire(self.logic.confettis, self.logic.session_decouvertes)
+            with mesurer("dessiner_victoire"):
+                self.game_renderer.dessiner_victoire(self.logic.confettis, self.logic.session_decouvertes)
 
-        pygame.display.flip()
+    def _actualiser_zones(self, fond: pygame.Surface) -> List[pygame.Rect]:
+        """Repeint les seuls éléments animés de la scène et retourne les zones modifiées."""
+        if self.logic.etat == GameState.SPLASH:
+            with self.profileur.mesurer("actualiser_barre"):
+                return self.menu_renderer.actualiser_barre(fond, self.logic.progression_chargement())
+        if self.logic.etat == GameState.CELEBRATION:
+            with self.profileur.mesurer("actualiser_victoire"):
+                return self.game_renderer.actualiser_victoire(fond, self.logic.confettis,
+                                                              self.logic.session_decouvertes)
+        return []
 
     def lancer(self) -> None:
         """Boucle principale d'exécution."""
         print("🚀 Lancement du Prototype V1 (Session Senior)")
         while self.en_cours:
-            self.orchestrer_entrees()
-            self.logic.mettre_a_jour()
-            self.dessiner()
-            self.clock.tick(60)
+            self.iteration()
+        self.preparateur_fonds.fermer()
+        self.chargeur.fermer()
+        self.db.close()
+        self.assets.fermer()
+        self.profileur.exporter_csv()
         pygame.quit()
 
+    def iteration(self, evenements: Optional[List[pygame.event.Event]] = None,
+                  horloge: Callable[[], float] = time.perf_counter) -> float:
+        """
+        Un tour de boucle : attente, entrées, logique puis rendu (étapes chronométrées).
+
+        Args:
+            evenements: Événements à traiter ; si None, attend ceux de pygame.
+            horloge: Source de temps (s) du chronométrage de la frame.
+
+        Returns:
+            Durée de travail de la frame en ms (attente exclue).
+        """
+        if evenements is None:
+            evenements = self._attendre_evenements()
+        debut = horloge()
+        with self.profileur.mesurer("entrees"):
+            self.orchestrer_entrees(evenements)
+        with self.profileur.mesurer("logique"):
+            self.logic.mettre_a_jour()
+        self.dessiner()
+        self.profileur.fin_frame(self.logic.etat)
+        duree_ms = (horloge() - debut) * 1000
+        self._gouverner(duree_ms)
+        return duree_ms
+
+    def _gouverner(self, duree_ms: float) -> None:
+        """Soumet la durée d'une frame animée en jeu au gouverneur et applique son verdict."""
+        # Les frames du splash incluent le pompage du chargeur : elles ne mesurent pas le rendu
+        if (Config.RESOLUTION_DYNAMIQUE and self.logic.est_anime()
+                and self.logic.etat != GameState.SPLASH):
+            if self.gouverneur.enregistrer(duree_ms):
+                self._synchroniser_echelle()
+
 if __name__ == "__main__":
     app = GameApp()
     app.lancer()
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import argparse
+
+# Rendu sans fenêtre : le benchmark doit tourner sur n'importe quelle machine
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Ajout du chemin parent pour importer main
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+from main import Config, ConfettiSystem, GameRenderer
+
+
+def dessiner_sans_atlas(screen, confettis):
+    """Reproduit l'ancien rendu : une Surface + une rotation par particule et par frame."""
+    xs, ys, tailles, angles, couleurs = confettis.particules_actives()
+    for x, y, taille, angle, couleur in zip(xs.tolist(), ys.tolist(), tailles.tolist(),
+                                             angles.tolist(), couleurs.tolist()):
+        p_surf = pygame.Surface((taille, taille), pygame.SRCALPHA)
+        pygame.draw.rect(p_surf, couleur, (0, 0, taille, taille))
+        rotated = pygame.transform.rotate(p_surf, angle)
+        screen.blit(rotated, (x, y))
+
+
+def mesurer(nom, dessiner, screen, particules, frames):
+    """Chronomètre `frames` frames de célébration et affiche moyenne / p95."""
+    confettis = ConfettiSystem(particules)
+    confettis.emettre(particules, -800, Config.HAUTEUR_ECRAN)
+    durees = []
+    for _ in range(frames):
+        debut = time.perf_counter()
+        screen.fill(Config.FOND_ROSE)
+        confettis.emettre(Config.CONFETTIS_PAR_FRAME, -20, -20)
+        confettis.mettre_a_jour()
+        dessiner(confettis)
+        durees.append((time.perf_counter() - debut) * 1000)
+
+    durees.sort()
+    moyenne = sum(durees) / len(durees)
+    p95 = durees[int(len(durees) * 0.95) - 1]
+    print(f"{nom:<12} {particules:>6} particules : moyenne {moyenne:6.2f} ms | p95 {p95:6.2f} ms")
+    return moyenne
+
+
+def bench_confettis():
+    parser = argparse.ArgumentParser(description="Compare le rendu des confettis avant/après l'atlas.")
+    parser.add_argument("--particules", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((Config.LARGEUR_ECRAN, Config.HAUTEUR_ECRAN))
+    renderer = GameRenderer(screen)
+
+    print("--- Benchmark rendu confettis (temps par frame) ---")
+    for n in args.particules:
+        avant = mesurer("sans atlas", lambda c: dessiner_sans_atlas(screen, c), screen, n, args.frames)
+        apres = mesurer("atlas", renderer._dessiner_confettis, screen, n, args.frames)
+        print(f"   ➜ gain x{avant / apres:.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    bench_confettis()
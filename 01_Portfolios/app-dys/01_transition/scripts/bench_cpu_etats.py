@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import argparse
+
+# Exécution sans fenêtre ni carte son
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Ajout du chemin parent pour importer main (et lancement depuis la racine du projet)
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RACINE)
+os.chdir(RACINE)
+import pygame
+from main import Config, GameApp, GameState
+
+EVENEMENT_FIN = pygame.event.custom_type()
+
+
+def preparer_etat(app, etat):
+    """Place l'application dans l'état à mesurer."""
+    if etat == GameState.START:
+        app.logic.changer_etat(GameState.START)
+    elif etat == GameState.PLAYING_QUESTION:
+        app.logic.charger_contenu("letter")
+        app._actualiser_fond()
+    elif etat == GameState.CELEBRATION:
+        app.logic.lancer_celebration()
+
+
+def mesurer(app, etat, duree_s):
+    """Fait tourner la boucle `duree_s` secondes et retourne l'usage CPU (%)."""
+    preparer_etat(app, etat)
+    # Réveil garanti en fin de mesure, même si la boucle dort sans timer
+    pygame.time.set_timer(EVENEMENT_FIN, int(duree_s * 1000), loops=1)
+
+    cpu_debut, mur_debut = time.process_time(), time.perf_counter()
+    iterations = 0
+    while time.perf_counter() - mur_debut < duree_s:
+        app.iteration()
+        iterations += 1
+    cpu = time.process_time() - cpu_debut
+    mur = time.perf_counter() - mur_debut
+    return cpu / mur * 100, iterations / mur
+
+
+def bench_cpu_etats():
+    parser = argparse.ArgumentParser(description="Usage CPU par GameState : boucle fixe vs boucle économe.")
+    parser.add_argument("--duree", type=float, default=5.0, help="Durée de mesure par état (s)")
+    args = parser.parse_args()
+
+    app = GameApp()
+    etats = [GameState.START, GameState.PLAYING_QUESTION, GameState.CELEBRATION]
+
+    print("--- Usage CPU par état (boucle fixe ➜ boucle économe) ---")
+    for etat in etats:
+        resultats = []
+        for econome in (False, True):
+            Config.BOUCLE_ECONOME = econome
+            resultats.append(mesurer(app, etat, args.duree))
+        (cpu_fixe, fps_fixe), (cpu_eco, fps_eco) = resultats
+        print(f"{etat.name:<18} CPU {cpu_fixe:5.1f}% ➜ {cpu_eco:5.1f}%   "
+              f"| itérations/s {fps_fixe:5.1f} ➜ {fps_eco:5.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    bench_cpu_etats()
@@ -0,0 +1,164 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+# Exécution sans fenêtre ni carte son (serveur Linux headless)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Ajout du chemin parent pour importer main (et lancement depuis la racine du projet)
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RACINE)
+os.chdir(RACINE)
+import pygame
+from main import Config, FontRegistry, GameApp, GameState
+
+# Réveille la boucle économe pendant les pauses du scénario (ignoré par le jeu)
+EVENEMENT_REVEIL = pygame.event.custom_type()
+
+
+def scenario_alphabet(pause_ms, nb_droite):
+    """Menu ➜ lettres ➜ `nb_droite` appuis sur DROITE ➜ célébration ➜ sortie."""
+    etapes = [("etat", GameState.START), ("touche", pygame.K_1), ("pause", pause_ms)]
+    for _ in range(nb_droite):
+        etapes += [("touche", pygame.K_RIGHT), ("pause", pause_ms)]
+    etapes += [("etat", GameState.CELEBRATION), ("pause", 3000), ("touche", pygame.K_ESCAPE)]
+    return etapes
+
+
+class Pilote:
+    """Rejoue un scénario d'entrées via pygame.event.post, au rythme de la boucle du jeu."""
+
+    def __init__(self, app, etapes):
+        self.app = app
+        self.etapes = list(etapes)
+        self._fin_pause = None
+
+    def avancer(self):
+        """Exécute toutes les étapes prêtes ; s'arrête sur une attente non satisfaite."""
+        while self.etapes:
+            genre, valeur = self.etapes[0]
+            if genre == "etat":
+                if self.app.logic.etat != valeur:
+                    return
+            elif genre == "pause":
+                if self._fin_pause is None:
+                    self._fin_pause = time.perf_counter() + valeur / 1000
+                    pygame.time.set_timer(EVENEMENT_REVEIL, max(1, int(valeur)), loops=1)
+                if time.perf_counter() < self._fin_pause:
+                    return
+                self._fin_pause = None
+            elif genre == "touche":
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=valeur, mod=0, unicode="", scancode=0))
+            self.etapes.pop(0)
+
+
+def percentiles(valeurs):
+    if not valeurs:
+        return {}
+    v = sorted(valeurs)
+    rang = lambda p: v[min(len(v) - 1, int(len(v) * p))]
+    return {
+        "moyenne": round(sum(v) / len(v), 3),
+        "p50": round(rang(0.50), 3),
+        "p90": round(rang(0.90), 3),
+        "p95": round(rang(0.95), 3),
+        "p99": round(rang(0.99), 3),
+        "max": round(v[-1], 3),
+    }
+
+
+def commit_courant():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def bench_harness():
+    parser = argparse.ArgumentParser(description="Rejoue une session scriptée de GameApp et mesure la boucle.")
+    parser.add_argument("--sortie", default=None, help="Fichier JSON de résultats (stdout par défaut)")
+    parser.add_argument("--pause-ms", type=int, default=300, help="Pause entre deux touches")
+    parser.add_argument("--droite", type=int, default=26, help="Nombre d'appuis sur DROITE")
+    parser.add_argument("--boucle-fixe", action="store_true", help="Désactive la boucle économe")
+    parser.add_argument("--echelle-fixe", action="store_true", help="Désactive la résolution dynamique")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Durée maximale (s)")
+    args = parser.parse_args()
+
+    Config.BOUCLE_ECONOME = not args.boucle_fixe
+    Config.RESOLUTION_DYNAMIQUE = not args.echelle_fixe
+    tracemalloc.start()
+    debut_init = time.perf_counter()
+    app = GameApp()
+    duree_init = time.perf_counter() - debut_init
+    instantane_init = tracemalloc.take_snapshot()
+
+    pilote = Pilote(app, scenario_alphabet(args.pause_ms, args.droite))
+    frames_ms, par_etat = [], {}
+    debut = time.perf_counter()
+    while app.en_cours and time.perf_counter() - debut < args.timeout:
+        pilote.avancer()
+        etat = app.logic.etat
+        debut_tour = time.perf_counter()
+        # Même boucle que le jeu ; le temps de frame exclut l'attente (tick ou sommeil de la boucle économe)
+        travail_ms = app.iteration(app._attendre_evenements(), horloge=time.perf_counter)
+        fin = time.perf_counter()
+        frames_ms.append(travail_ms)
+        stats = par_etat.setdefault(etat.name, {"duree_s": 0.0, "frames": []})
+        stats["duree_s"] += fin - debut_tour
+        stats["frames"].append(travail_ms)
+
+    duree_totale = time.perf_counter() - debut
+    courant, pic = tracemalloc.get_traced_memory()
+    diff = tracemalloc.take_snapshot().compare_to(instantane_init, "lineno")
+    tracemalloc.stop()
+
+    resultats = {
+        "commit": commit_courant(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "boucle_econome": Config.BOUCLE_ECONOME,
+        "resolution_dynamique": Config.RESOLUTION_DYNAMIQUE,
+        "echelle_finale": app.gouverneur.echelle,
+        "scenario_termine": not pilote.etapes,
+        "duree_init_s": round(duree_init, 3),
+        "duree_totale_s": round(duree_totale, 3),
+        "frames": len(frames_ms),
+        "frame_ms": percentiles(frames_ms),
+        "par_etat": {
+            nom: {"duree_s": round(s["duree_s"], 3), "frames": len(s["frames"]), "frame_ms": percentiles(s["frames"])}
+            for nom, s in par_etat.items()
+        },
+        "allocations": {
+            "courant_octets": courant,
+            "pic_octets": pic,
+            "principales": [
+                {"site": str(d.traceback), "octets": d.size_diff, "blocs": d.count_diff}
+                for d in diff[:10]
+            ],
+        },
+        "caches": {
+            "textes": app.cache_textes.statistiques(),
+            "assets": app.assets.statistiques(),
+            "polices": FontRegistry.partage().statistiques(),
+        },
+    }
+    pygame.quit()
+
+    sortie = json.dumps(resultats, indent=2, ensure_ascii=False)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            f.write(sortie)
+        print(f"✅ Résultats écrits dans {args.sortie}")
+    else:
+        print(sortie)
+
+
+if __name__ == "__main__":
+    bench_harness()
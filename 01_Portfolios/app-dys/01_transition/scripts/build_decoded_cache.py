@@ -0,0 +1,54 @@
+import os
+import sys
+import json
+import time
+
+# Le décodage n'a besoin ni de fenêtre ni de carte son
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Ajout du chemin parent pour importer les modules du jeu (chemins relatifs à la racine)
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RACINE)
+os.chdir(RACINE)
+import pygame
+from db_manager import DBManager
+from decoded_cache import DOSSIER_DEFAUT, construire_cache
+from main import AssetManager
+
+
+def contenus_references():
+    """Lignes du backup local et de la table educational_content (si joignable)."""
+    lignes = []
+    if os.path.exists("backup_list.json"):
+        with open("backup_list.json", "r", encoding="utf-8") as f:
+            lignes.extend(json.load(f))
+    manager = DBManager()
+    if manager.client:
+        lignes.extend(manager.get_educational_content())
+    return lignes
+
+
+def build_decoded_cache():
+    """Transcode chaque asset référencé en PCM / RGBA bruts dans le cache décodé."""
+    # Même initialisation que GameApp : le PCM doit correspondre au format du mixer
+    pygame.init()
+    pygame.mixer.init()
+    print(f"🎚️ Format du mixer : {pygame.mixer.get_init()}")
+
+    lignes = contenus_references()
+    images = [d.get("image_url") for d in lignes if d.get("image_url")]
+    sons = [d.get("sound_url") for d in lignes if d.get("sound_url")]
+    travaux = [(type_res, chemin) for type_res, _, chemin in AssetManager().a_charger(images, sons)]
+    print(f"🔧 {len(travaux)} assets à pré-décoder ({len(lignes)} lignes de contenu)...")
+
+    debut = time.perf_counter()
+    compteurs = construire_cache(travaux, DOSSIER_DEFAUT)
+    print(f"✅ Cache décodé à jour dans {DOSSIER_DEFAUT} : {compteurs['ecrits']} écrits, "
+          f"{compteurs['inchanges']} inchangés, {compteurs['erreurs']} erreurs "
+          f"({(time.perf_counter() - debut) * 1000:.0f} ms).")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    build_decoded_cache()
@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+# Ajout du chemin parent pour importer asset_pack
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RACINE)
+from asset_pack import construire_paquet, normaliser
+from asset_manifest import AssetManifest
+
+
+def build_pack():
+    """Regroupe assets/ dans un seul fichier indexé, lu par mmap au lancement du jeu."""
+    dossier = os.path.join(RACINE, "assets")
+    destination = os.path.join(RACINE, "assets.pack")
+
+    # Entrées du paquet : liste des fichiers avec taille et date (reconstruit seulement si elle change)
+    fichiers = []
+    for racine, _, noms in os.walk(dossier):
+        for nom in noms:
+            if not nom.startswith("."):
+                st = os.stat(os.path.join(racine, nom))
+                fichiers.append([normaliser(os.path.relpath(os.path.join(racine, nom), RACINE)),
+                                 st.st_size, st.st_mtime_ns])
+    entrees = {"fichiers": sorted(fichiers)}
+    manifeste = AssetManifest(os.path.join(RACINE, "assets_manifest.json"))
+    if manifeste.a_jour(destination, entrees):
+        print(f"✅ {destination} déjà à jour ({len(fichiers)} fichiers).")
+        return
+
+    print(f"📦 Construction du paquet depuis {dossier}...")
+    debut = time.perf_counter()
+    nombre = construire_paquet(dossier, destination)
+    taille = os.path.getsize(destination) / 1e6
+    manifeste.enregistrer(destination, "paquet", entrees)
+    manifeste.sauver()
+    print(f"✅ {nombre} fichiers empaquetés dans {destination} ({taille:.1f} Mo, "
+          f"{(time.perf_counter() - debut) * 1000:.0f} ms).")
+
+
+if __name__ == "__main__":
+    build_pack()
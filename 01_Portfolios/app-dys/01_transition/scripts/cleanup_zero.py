@@ -5,19 +5,21 @@ from dotenv import load_dotenv
 # Ajout du chemin parent pour importer db_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db_manager import DBManager
+from content_repository import ContentRepository
 
 def cleanup():
     manager = DBManager()
     if not manager.client:
         return
 
-    data = manager.get_educational_content(content_type="number")
-    for d in data:
-        if d['content'] == "0":
-            print(f"🗑️ Trouvé '0' avec ID: {d['id']}")
-            res = manager.client.table("educational_content").delete().eq("id", d['id']).execute()
-            print(f"✅ Résultat: {len(res.data)} supprimé.")
-            break
+    # Recherche filtrée côté serveur : seule la ligne '0' est transférée
+    d = ContentRepository(manager).get("number", "0")
+    if d:
+        print(f"🗑️ Trouvé '0' avec ID: {d['id']}")
+        # Désactivation plutôt que DELETE : la synchronisation incrémentale (sync_backup.py)
+        # ne voit pas les suppressions physiques
+        res = manager.client.table("educational_content").update({"is_active": False}).eq("id", d['id']).execute()
+        print(f"✅ Résultat: {len(res.data)} désactivé.")
     else:
         print("ℹ️ Aucun '0' trouvé dans Content.")
 
@@ -12,14 +12,16 @@ def delete_zero():
         print("❌ Erreur : Impossible d'initialiser le client Supabase.")
         return
 
-    print("🗑️ Suppression du chiffre '0'...")
+    print("🗑️ Retrait du chiffre '0'...")
     try:
+        # Désactivation plutôt que DELETE : la synchronisation incrémentale (sync_backup.py)
+        # ne voit pas les suppressions physiques
         response = manager.client.table("educational_content")\
-            .delete()\
+            .update({"is_active": False})\
             .eq("content", "0")\
             .eq("type", "number")\
             .execute()
-        print(f"✅ Supprimé : {len(response.data)} ligne(s).")
+        print(f"✅ Retiré : {len(response.data)} ligne(s) désactivée(s).")
     except Exception as e:
         print(f"❌ Erreur lors de la suppression : {e}")
 
@@ -1,79 +1,252 @@
 import os
 import sys
-from gtts import gTTS
+import json
+import time
+import math
+import wave
+import struct
+import shutil
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Ajout du chemin parent pour importer db_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from db_manager import DBManager
+from db_manager import DBManager, SNAPSHOT_PATH, sort_key
+from content_snapshot import lire_snapshot
+from content_repository import ContentRepository
+from seed_content import upsert_rows
+from asset_manifest import AssetManifest
+
+# Configuration des dossiers
+BASE_DIR = "assets/sounds"
+# Sortie des moteurs factices : jamais dans les assets du jeu
+SCRATCH_DIR = ".cache/tts_stub"
+BACKUP_PATH = "backup_list.json"
+
+
+# --- Moteurs de synthèse (interchangeables) ---
+
+class GTTSEngine:
+    """Google Text-to-Speech (réseau requis)."""
+    name = "gtts"
+    extension = "mp3"
+    fake = False
+
+    def __init__(self, lang="fr"):
+        from gtts import gTTS
+        self._gtts = gTTS
+        self.lang = lang
+        self.voice = lang
+
+    def synthesize(self, text, path):
+        self._gtts(text=text, lang=self.lang).save(path)
+
+
+class EspeakEngine:
+    """Synthèse locale hors-ligne via espeak-ng / espeak (aucun réseau)."""
+    name = "espeak"
+    extension = "wav"
+    fake = False
+
+    def __init__(self, lang="fr"):
+        self.binary = shutil.which("espeak-ng") or shutil.which("espeak")
+        if not self.binary:
+            raise RuntimeError("espeak-ng (ou espeak) est introuvable dans le PATH")
+        self.lang = lang
+        self.voice = lang
+
+    def synthesize(self, text, path):
+        subprocess.run([self.binary, "-v", self.lang, "-w", path, text],
+                       check=True, capture_output=True, timeout=30)
+
+
+class StubEngine:
+    """
+    Moteur factice pour tester et mesurer le pipeline sans réseau :
+    écrit un bip WAV et simule la latence d'un service distant.
+    Ses fichiers ne doivent jamais être référencés en base (fake = True).
+    """
+    name = "stub"
+    extension = "wav"
+    voice = "bip-440hz"
+    fake = True
+
+    def __init__(self, latency_ms=0, failure_rate=0.0):
+        self.latency = latency_ms / 1000
+        self.failure_rate = failure_rate
+        # Compteur partagé par les threads du pool : taux d'échec exact quel que soit l'ordre
+        self._calls = 0
+        self._calls_lock = threading.Lock()
+
+    def synthesize(self, text, path):
+        time.sleep(self.latency)
+        with self._calls_lock:
+            self._calls += 1
+            call = self._calls
+        if self.failure_rate and (call * 7919 % 100) < self.failure_rate * 100:
+            raise RuntimeError("échec simulé")
+        rate, duration = 22050, 0.2
+        frames = b"".join(struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+                          for i in range(int(rate * duration)))
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(rate)
+            f.writeframes(frames)
+
+
+ENGINES = {"gtts": GTTSEngine, "espeak": EspeakEngine, "stub": StubEngine}
+
+
+# --- Pipeline ---
+
+def load_offline_items():
+    """Lettres puis chiffres depuis content.snapshot (ou backup_list.json), sans aucun accès réseau."""
+    snapshot = lire_snapshot(SNAPSHOT_PATH)
+    if snapshot is not None:
+        return snapshot.lignes("letter") + snapshot.lignes("number")
+    try:
+        with open(BACKUP_PATH, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⚠️ Aucun contenu local ({SNAPSHOT_PATH}, {BACKUP_PATH}) : {e}")
+        return []
+    return sorted((row for row in rows if row.get("type") in ("letter", "number")), key=sort_key)
+
+
+def build_jobs(items, engine, base_dir=BASE_DIR):
+    """Une tâche par élément : texte à prononcer, fichier à écrire, chemin enregistré en base."""
+    jobs = []
+    for item in items:
+        folder = "letters" if item["type"] == "letter" else "numbers"
+        # Les lettres sont prononcées telles quelles, les chiffres avec le mot complet (ex: "vingt-deux")
+        text = item["content"] if item["type"] == "letter" else (item.get("word") or item["content"])
+        db_path = f"{base_dir}/{folder}/{item['content']}.{engine.extension}"
+        # Tout ce qui détermine le fichier produit (clé du manifeste)
+        inputs = {"text": text, "engine": engine.name, "voice": engine.voice, "format": engine.extension}
+        jobs.append({"item": item, "text": text, "path": db_path, "inputs": inputs})
+    return jobs
+
+
+def origin(item):
+    """Champs de la ligne de contenu rattachés à l'asset dans le manifeste."""
+    return {k: item[k] for k in ("id", "type", "content", "word") if k in item}
+
+
+def synthesize_with_retry(engine, job, attempts, backoff):
+    """Synthétise un élément, en réessayant avec un délai croissant. Lève la dernière erreur."""
+    for attempt in range(1, attempts + 1):
+        try:
+            tmp_path = job["path"] + ".tmp." + engine.extension
+            engine.synthesize(job["text"], tmp_path)
+            os.replace(tmp_path, job["path"])
+            return attempt
+        except Exception:
+            if attempt == attempts:
+                raise
+            time.sleep(backoff * 2 ** (attempt - 1))
+
+
+def run_pipeline(engine, jobs, workers, attempts=3, backoff=0.5):
+    """
+    Lance les synthèses dans un pool borné.
+    :return: (tâches réussies, tâches en échec)
+    """
+    done, failed = [], []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts") as pool:
+        futures = {pool.submit(synthesize_with_retry, engine, job, attempts, backoff): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                tries = future.result()
+                done.append(job)
+                suffix = f" (après {tries} essais)" if tries > 1 else ""
+                print(f"   ✅ {job['text']} → {job['path']}{suffix}")
+            except Exception as e:
+                failed.append(job)
+                print(f"   ❌ {job['text']} : {e}")
+    return done, failed
+
 
 def generate_audio():
-    manager = DBManager()
-    if not manager.client:
-        print("❌ Erreur : Impossible d'initialiser le client Supabase.")
-        return
+    parser = argparse.ArgumentParser(description="Génère les sons des lettres et chiffres en parallèle.")
+    parser.add_argument("--moteur", choices=sorted(ENGINES), default="gtts", help="Moteur de synthèse")
+    parser.add_argument("--workers", type=int, default=8, help="Synthèses simultanées")
+    parser.add_argument("--essais", type=int, default=3, help="Tentatives par élément")
+    parser.add_argument("--lot", type=int, default=100, help="Lignes par mise à jour groupée de sound_url")
+    parser.add_argument("--latence-ms", type=int, default=300, help="Latence simulée (moteur stub)")
+    parser.add_argument("--force", action="store_true", help="Régénère tout, même les fichiers à jour")
+    parser.add_argument("--sans-db", action="store_true",
+                        help="Contenu de secours local, sans mise à jour de la base (mesures hors-ligne)")
+    args = parser.parse_args()
+
+    # Moteur de mesure : ses bips ne doivent jamais remplacer les sound_url de production
+    if ENGINES[args.moteur].fake and not args.sans_db:
+        print(f"ℹ️ Moteur {args.moteur} : mode --sans-db activé (aucune écriture en base).")
+        args.sans_db = True
 
-    # Configuration des dossiers
-    base_dir = "assets/sounds"
-    letters_dir = os.path.join(base_dir, "letters")
-    numbers_dir = os.path.join(base_dir, "numbers")
+    # Hors-ligne : contenu local uniquement, aucune connexion Supabase
+    manager = None
+    if not args.sans_db:
+        manager = DBManager()
+        if not manager.client:
+            print("❌ Erreur : Impossible d'initialiser le client Supabase.")
+            return
 
-    for d in [letters_dir, numbers_dir]:
+    engine = StubEngine(args.latence_ms) if args.moteur == "stub" else ENGINES[args.moteur]()
+    # Les bips du moteur factice vont dans un dossier de travail, hors des assets et du manifeste
+    base_dir = SCRATCH_DIR if engine.fake else BASE_DIR
+
+    for d in [os.path.join(base_dir, "letters"), os.path.join(base_dir, "numbers")]:
         if not os.path.exists(d):
             os.makedirs(d)
             print(f"📁 Création du dossier : {d}")
 
-    # 1. Génération pour les Lettres (A-Z)
-    print("🔤 Génération des fichiers audio pour les lettres...")
-    letters_data = manager.get_educational_content(content_type="letter")
-    for item in letters_data:
-        char = item['content']
-        # Pour les lettres, on prononce juste la lettre (en majuscule pour être sûr)
-        # Mais pour certaines comme 'Y', gTTS est parfois capricieux si c'est minuscule.
-        filename = f"{char}.mp3"
-        filepath = os.path.join(letters_dir, filename)
-        db_path = f"assets/sounds/letters/{filename}"
-        
-        print(f"   Génération de : {char}...", end=" ", flush=True)
-        try:
-            tts = gTTS(text=char, lang='fr')
-            tts.save(filepath)
-            
-            # Mise à jour DB
-            manager.client.table("educational_content")\
-                .update({"sound_url": db_path})\
-                .eq("id", item['id'])\
-                .execute()
-            print("OK")
-        except Exception as e:
-            print(f"ERREUR : {e}")
-
-    # 2. Génération pour les Chiffres (1-30)
-    print("🔢 Génération des fichiers audio pour les chiffres...")
-    numbers_data = manager.get_educational_content(content_type="number")
-    for item in numbers_data:
-        char = item['content']
-        word = item['word']
-        filename = f"{char}.mp3"
-        filepath = os.path.join(numbers_dir, filename)
-        db_path = f"assets/sounds/numbers/{filename}"
-        
-        print(f"   Génération de : {word}...", end=" ", flush=True)
-        try:
-            # Pour les chiffres, on utilise le mot complet (ex: "vingt-deux")
-            tts = gTTS(text=word, lang='fr')
-            tts.save(filepath)
-            
-            # Mise à jour DB
-            manager.client.table("educational_content")\
-                .update({"sound_url": db_path})\
-                .eq("id", item['id'])\
-                .execute()
-            print("OK")
-        except Exception as e:
-            print(f"ERREUR : {e}")
-
-    print("✅ Génération audio et mise à jour DB terminées.")
+    if manager is None:
+        items = load_offline_items()
+    else:
+        repo = ContentRepository(manager)
+        items = repo.all("letter") + repo.all("number")
+    jobs = build_jobs(items, engine, base_dir)
+
+    # Construction incrémentale : seuls les éléments dont les entrées ont changé sont synthétisés
+    manifest = AssetManifest()
+    up_to_date = [] if args.force or engine.fake else [job for job in jobs
+                                                        if manifest.a_jour(job["path"], job["inputs"])]
+    skipped = {job["path"] for job in up_to_date}
+    todo = [job for job in jobs if job["path"] not in skipped]
+    print(f"🔊 {len(todo)} fichier(s) à générer avec {engine.name} ({args.workers} en parallèle), "
+          f"{len(up_to_date)} à jour.")
+
+    t0 = time.perf_counter()
+    done, failed = run_pipeline(engine, todo, max(1, args.workers), max(1, args.essais))
+    elapsed = time.perf_counter() - t0
+    print(f"⏱️ Synthèse : {len(done)} OK, {len(failed)} en échec en {elapsed:.2f} s "
+          f"({len(done) / elapsed if elapsed else 0:.1f} fichiers/s).")
+
+    if not engine.fake:
+        for job in done:
+            manifest.enregistrer(job["path"], "audio", job["inputs"], origin(job["item"]))
+        manifest.sauver()
+
+    # Mise à jour DB groupée : un upsert par lot au lieu d'un update par ligne
+    # (les fichiers à jour dont le sound_url en base diffère sont aussi corrigés, moteurs réels uniquement)
+    stale_urls = [] if engine.fake else [job for job in up_to_date
+                                         if job["item"].get("sound_url") != job["path"]]
+    if manager is not None and (done or stale_urls):
+        rows = [{"content": job["item"]["content"], "type": job["item"]["type"], "sound_url": job["path"]}
+                for job in done + stale_urls]
+        upsert_rows(manager.client, rows, max(1, args.lot))
+
+    if failed:
+        print(f"⚠️ Terminé avec {len(failed)} élément(s) en échec.")
+    else:
+        print("✅ Génération audio et mise à jour DB terminées." if manager is not None
+              else "✅ Génération audio terminée (base non modifiée).")
+
 
 if __name__ == "__main__":
     generate_audio()
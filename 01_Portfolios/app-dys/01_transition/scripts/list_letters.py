@@ -5,13 +5,13 @@ from dotenv import load_dotenv
 # Ajout du chemin parent pour importer db_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db_manager import DBManager
+from content_repository import ContentRepository
 
 def list_letters():
     manager = DBManager()
-    data = manager.get_educational_content(content_type="letter")
+    # Lettres actives, déjà triées (A-Z)
+    data = ContentRepository(manager).all("letter")
     if data:
-        # Trier par contenu (A-Z)
-        data.sort(key=lambda x: x.get('content', ''))
         for item in data:
             print(f"{item.get('content')} : {item.get('word')}")
     else:
@@ -0,0 +1,43 @@
+import os
+import sys
+import argparse
+
+# Ajout du chemin parent pour importer les modules du projet (chemins relatifs à la racine)
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RACINE)
+os.chdir(RACINE)
+from asset_manifest import AssetManifest, CHEMIN_DEFAUT
+from content_repository import ContentRepository
+
+# Assets utilisés directement par le jeu, sans ligne dans educational_content
+EXTRAS = ["assets/sounds/effects/fireworks.mp3"]
+
+
+def manifest():
+    parser = argparse.ArgumentParser(description="Consulte le manifeste de construction des assets.")
+    parser.add_argument("--check", action="store_true",
+                        help="Signale les fichiers périmés, manquants ou orphelins de assets/ (code 1 si problème)")
+    args = parser.parse_args()
+
+    manifeste = AssetManifest(CHEMIN_DEFAUT)
+    if not args.check:
+        genres = {}
+        for entree in manifeste.entrees.values():
+            genres[entree["genre"]] = genres.get(entree["genre"], 0) + 1
+        print(f"📒 {len(manifeste.entrees)} sortie(s) suivie(s) dans {CHEMIN_DEFAUT} : {genres}")
+        return
+
+    # Contenu actif uniquement : l'asset d'une ligne désactivée ou supprimée est signalé périmé
+    lignes = ContentRepository().load().all()
+    rapport = manifeste.verifier(lignes, "assets", EXTRAS)
+    for categorie, titre in (("perimes", "🕰️ Périmés"), ("manquants", "❓ Manquants"), ("orphelins", "🧹 Orphelins")):
+        print(f"{titre} : {len(rapport[categorie])}")
+        for chemin in rapport[categorie]:
+            print(f"   - {chemin}")
+    if any(rapport.values()):
+        sys.exit(1)
+    print("✅ Assets conformes au manifeste.")
+
+
+if __name__ == "__main__":
+    manifest()
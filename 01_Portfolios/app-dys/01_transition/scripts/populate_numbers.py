@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 # Ajout du chemin parent pour importer db_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db_manager import DBManager
+from seed_content import upsert_rows
 
 def populate_numbers():
     manager = DBManager()
@@ -21,43 +22,19 @@ def populate_numbers():
         ("26", "vingt-six"), ("27", "vingt-sept"), ("28", "vingt-huit"), ("29", "vingt-neuf"), ("30", "trente")
     ]
 
-    print(f"🚀 Insertion de {len(numbers_data)} nombres dans Supabase...")
+    rows = [{
+        "content": char,
+        "type": "number",
+        "word": word,
+        "image_url": None,
+        "sound_url": f"assets/sounds/chiffre_{char}.mp3",
+        "is_active": True
+    } for char, word in numbers_data]
 
-    for char, word in numbers_data:
-        data = {
-            "content": char,
-            "type": "number",
-            "word": word,
-            "image_url": None,
-            "sound_url": f"assets/sounds/chiffre_{char}.mp3",
-            "is_active": True
-        }
-        
-        try:
-            # On utilise upsert sur content + type si possible, 
-            # mais ici on va juste faire un insert simple ou vérifier si ça existe déjà.
-            # Pour éviter les doublons si on relance le script :
-            existing = manager.client.table("educational_content")\
-                .select("id")\
-                .eq("content", char)\
-                .eq("type", "number")\
-                .execute()
-            
-            if existing.data:
-                print(f"➖ {char} existe déjà, mise à jour...")
-                manager.client.table("educational_content")\
-                    .update(data)\
-                    .eq("content", char)\
-                    .eq("type", "number")\
-                    .execute()
-            else:
-                print(f"➕ Insertion de {char} ({word})...")
-                manager.client.table("educational_content").insert(data).execute()
-                
-        except Exception as e:
-            print(f"❌ Erreur pour {char} : {e}")
-
-    print("✅ Opération terminée.")
+    # Un seul upsert groupé sur (content, type) : relancer le script met à jour sans doublon
+    print(f"🚀 Insertion de {len(rows)} nombres dans Supabase...")
+    written, failed = upsert_rows(manager.client, rows)
+    print("✅ Opération terminée." if not failed else f"❌ {failed} lot(s) en échec.")
 
 if __name__ == "__main__":
     populate_numbers()
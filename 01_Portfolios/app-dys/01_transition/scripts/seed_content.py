@@ -0,0 +1,112 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+
+# Ajout du chemin parent pour importer db_manager
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db_manager import DBManager
+
+TABLE = "educational_content"
+COLUMNS = ["content", "type", "word", "image_url", "sound_url", "is_active"]
+# Cible des upserts : contrainte UNIQUE (content, type) de setup_supabase.sql
+ON_CONFLICT = "content,type"
+
+
+def _is_blank(value):
+    """Valeur absente ou chaîne vide (0 et False restent des valeurs)."""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _as_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() not in ("0", "false", "faux", "non", "no", "")
+
+
+def read_definitions(path):
+    """
+    Lit les définitions de contenu depuis un fichier CSV (avec entête) ou JSON (liste d'objets).
+    :return: Lignes normalisées, dédoublonnées sur (content, type) — la dernière définition l'emporte
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if path.lower().endswith(".json"):
+            raw = json.load(f)
+        else:
+            raw = list(csv.DictReader(f))
+
+    # Seules les colonnes présentes dans le fichier sont envoyées :
+    # une colonne absente (ex: image_url, is_active) n'écrase pas la valeur déjà en base
+    columns = [col for col in COLUMNS if any(col in item for item in raw)]
+    rows = {}
+    for item in raw:
+        if _is_blank(item.get("content")) or _is_blank(item.get("type")):
+            print(f"⚠️ Ligne ignorée (content ou type manquant) : {item}")
+            continue
+        row = {col: (None if _is_blank(item.get(col)) else item.get(col)) for col in columns}
+        row["content"] = str(row["content"]).strip()
+        # is_active vide ou absent pour cette ligne : non spécifié, la valeur en base est conservée
+        # (une cellule vide ne doit jamais désactiver du contenu)
+        if row.pop("is_active", None) is not None:
+            row["is_active"] = _as_bool(item["is_active"])
+        # Un même lot ne peut pas toucher deux fois la même clé (erreur Postgres)
+        rows[(row["content"], row["type"])] = row
+    return list(rows.values())
+
+
+def upsert_rows(client, rows, batch_size=100):
+    """
+    Envoie les lignes par lots d'upserts (un appel HTTP par lot) et affiche un rapport par lot.
+    Un lot ne regroupe que des lignes ayant les mêmes colonnes (exigence de l'upsert groupé :
+    une colonne omise, ex: is_active non spécifié, n'est pas écrasée).
+    :return: (lignes écrites, lots en échec)
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    chunks = [group[start:start + batch_size]
+              for group in groups.values() for start in range(0, len(group), batch_size)]
+
+    written, failed = 0, 0
+    batches = len(chunks)
+    for n, batch in enumerate(chunks, 1):
+        t0 = time.perf_counter()
+        try:
+            res = client.table(TABLE).upsert(batch, on_conflict=ON_CONFLICT).execute()
+            written += len(res.data)
+            print(f"✅ Lot {n}/{batches} : {len(res.data)} ligne(s) en {(time.perf_counter() - t0) * 1000:.0f} ms "
+                  f"({batch[0]['type']} {batch[0]['content']} → {batch[-1]['type']} {batch[-1]['content']})")
+        except Exception as e:
+            failed += 1
+            print(f"❌ Lot {n}/{batches} en échec ({len(batch)} ligne(s)) : {e}")
+    return written, failed
+
+
+def seed():
+    parser = argparse.ArgumentParser(description="Importe du contenu pédagogique par upserts groupés.")
+    parser.add_argument("fichier", help="Définitions au format CSV (avec entête) ou JSON")
+    parser.add_argument("--lot", type=int, default=100, help="Nombre de lignes par upsert")
+    parser.add_argument("--simulation", action="store_true", help="Lit et valide sans rien envoyer")
+    args = parser.parse_args()
+
+    rows = read_definitions(args.fichier)
+    print(f"📄 {len(rows)} définition(s) lue(s) depuis {args.fichier}.")
+    if args.simulation or not rows:
+        return
+
+    manager = DBManager()
+    if not manager.client:
+        print("❌ Erreur : Impossible d'initialiser le client Supabase.")
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    written, failed = upsert_rows(manager.client, rows, max(1, args.lot))
+    print(f"🏁 {written}/{len(rows)} ligne(s) écrite(s) en {time.perf_counter() - t0:.2f} s, {failed} lot(s) en échec.")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    seed()
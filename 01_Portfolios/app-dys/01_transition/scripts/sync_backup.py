@@ -1,16 +1,82 @@
 import os
 import json
 import sys
+import argparse
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
+# Ajout du chemin parent pour importer le format d'instantané
+RACINE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(RACINE)
+from content_snapshot import ecrire_snapshot, lire_snapshot
+from asset_manifest import AssetManifest
+from db_manager import sort_key
+
 # Chargement des variables d'environnement
 load_dotenv()
 
+COLUMNS = "content, word, image_url, sound_url, type"
+# Filigrane de la dernière synchronisation (updated_at le plus récent reçu)
+STATE_PATH = os.path.join(RACINE, ".cache", "sync_backup.json")
+# updated_at vaut now(), l'heure de DÉBUT de la transaction : une transaction validée
+# après une synchronisation peut porter un horodatage antérieur au filigrane.
+# Cette fenêtre est relue à chaque fois (la fusion est idempotente).
+WATERMARK_OVERLAP = timedelta(minutes=1)
+
+
+def _parse_timestamp(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def load_state(snapshot_path):
+    """
+    Filigrane et contenu local de la dernière synchronisation.
+    :return: (filigrane, lignes) ou (None, None) si une synchronisation complète est nécessaire
+    """
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None, None
+    snapshot = lire_snapshot(snapshot_path)
+    # L'instantané doit être celui produit par la synchronisation qui a noté le filigrane
+    if snapshot is None or snapshot.crc != state.get("crc"):
+        print("Instantané local absent ou différent du dernier filigrane.")
+        return None, None
+    return state.get("watermark"), snapshot.lignes()
+
+
+def save_state(watermark, count, crc):
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    with open(STATE_PATH + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"watermark": watermark, "elements": count, "crc": crc}, f)
+    os.replace(STATE_PATH + ".tmp", STATE_PATH)
+
+
+def merge_changes(rows, changes):
+    """Applique les lignes modifiées : mise à jour ou ajout si active, retrait si désactivée."""
+    merged = {(row.get("type"), str(row.get("content"))): row for row in rows}
+    for change in changes:
+        key = (change.get("type"), str(change.get("content")))
+        if change.get("is_active") is False:
+            merged.pop(key, None)
+        else:
+            merged[key] = {col: change.get(col) for col in COLUMNS.split(", ")}
+    # Ordre stable : le manifeste compare le contenu ligne à ligne
+    return sorted(merged.values(), key=sort_key)
+
+
 def sync_letters():
     """
     Récupère les lettres depuis Supabase et les sauvegarde localement pour le mode hors-ligne.
+    Seules les lignes modifiées depuis le dernier filigrane sont téléchargées.
     """
+    parser = argparse.ArgumentParser(description="Synchronise le contenu de secours local.")
+    parser.add_argument("--complet", action="store_true",
+                        help="Ignore le filigrane et retélécharge tout (après une suppression physique)")
+    args = parser.parse_args()
+
     print("--- Démarrage de la synchronisation du backup ---")
     
     url = os.getenv("SUPABASE_URL")
@@ -24,20 +90,55 @@ def sync_letters():
         # Initialisation du client
         supabase: Client = create_client(url, key)
         
-        # Récupération des lettres
-        print("Récupération des lettres depuis Supabase...")
-        response = supabase.table("educational_content")\
-            .select("content, word, image_url, sound_url, type")\
-            .eq("type", "letter")\
-            .eq("is_active", True)\
-            .execute()
+        backup_path = os.path.join(RACINE, "backup_list.json")
+        snapshot_path = os.path.join(RACINE, "content.snapshot")
+        watermark, rows = (None, None) if args.complet else load_state(snapshot_path)
 
-        
-        letters = response.data
+        if watermark is not None:
+            # Lignes modifiées depuis le filigrane, désactivations comprises, avec une fenêtre
+            # de recouvrement pour les transactions validées tardivement (réappliquer une ligne est sans effet)
+            since = (_parse_timestamp(watermark) - WATERMARK_OVERLAP).isoformat()
+            print(f"Récupération des modifications depuis {since}...")
+            changes = supabase.table("educational_content")\
+                .select(COLUMNS + ", is_active, updated_at")\
+                .gte("updated_at", since)\
+                .order("updated_at")\
+                .execute().data
+            rows = merge_changes(rows, changes)
+            print(f"{len(changes)} ligne(s) modifiée(s) reçue(s).")
+
+            # Une suppression physique est invisible pour le filigrane : si le serveur
+            # ne compte pas autant de lignes actives que la fusion, on repart d'une copie complète
+            active_count = supabase.table("educational_content")\
+                .select("id", count="exact")\
+                .eq("is_active", True)\
+                .limit(1)\
+                .execute().count
+            if active_count != len(rows):
+                print(f"{active_count} ligne(s) active(s) sur le serveur contre {len(rows)} en local : "
+                      "synchronisation complète.")
+                watermark = None
+
+        if watermark is None:
+            # Récupération de tout le contenu actif (lettres et chiffres)
+            print("Récupération complète du contenu depuis Supabase...")
+            response = supabase.table("educational_content")\
+                .select(COLUMNS + ", updated_at")\
+                .eq("is_active", True)\
+                .order("updated_at")\
+                .execute()
+            rows = merge_changes([], response.data)
+            changes = response.data
+        # La fenêtre relue peut ne contenir que des lignes antérieures au filigrane
+        if changes and (watermark is None
+                        or _parse_timestamp(changes[-1]["updated_at"]) > _parse_timestamp(watermark)):
+            watermark = changes[-1]["updated_at"]
+
+        letters = [row for row in rows if row.get("type") == "letter"]
         
         # Sécurité critique : Vérifier la longueur
         letter_count = len(letters)
-        print(f"Nombre de lettres reçues : {letter_count}")
+        print(f"Nombre de lettres après synchronisation : {letter_count}")
         
         if letter_count < 26:
             print(f"❌ ERREUR CRITIQUE : Seules {letter_count} lettres ont été récupérées (26 minimum attendues).")
@@ -45,13 +146,31 @@ def sync_letters():
             sys.exit(1)
             
         # Sauvegarde dans backup_list.json à la racine
-        backup_path = os.path.join(os.path.dirname(__file__), "..", "backup_list.json")
-        backup_path = os.path.abspath(backup_path)
-        
-        print(f"Sauvegarde de {letter_count} lettres dans {backup_path}...")
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(letters, f, indent=4, ensure_ascii=False)
-            
+        manifest = AssetManifest(os.path.join(RACINE, "assets_manifest.json"))
+
+        # Fichiers réécrits seulement si le contenu reçu a changé
+        if manifest.a_jour(backup_path, {"rows": letters}):
+            print(f"backup_list.json déjà à jour ({letter_count} lettres).")
+        else:
+            print(f"Sauvegarde de {letter_count} lettres dans {backup_path}...")
+            with open(backup_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(letters, f, indent=4, ensure_ascii=False)
+            os.replace(backup_path + ".tmp", backup_path)
+            manifest.enregistrer(backup_path, "backup", {"rows": letters})
+
+        # Instantané binaire complet (tous types) lu par le jeu hors-ligne
+        if manifest.a_jour(snapshot_path, {"rows": rows}):
+            print(f"content.snapshot déjà à jour ({len(rows)} éléments).")
+        else:
+            count = ecrire_snapshot(rows, snapshot_path)
+            manifest.enregistrer(snapshot_path, "backup", {"rows": rows})
+            print(f"Instantané de {count} éléments écrit dans {snapshot_path}.")
+        manifest.sauver()
+        # Filigrane noté en dernier, rattaché à l'instantané écrit : un échec plus haut relancera depuis l'ancien
+        snapshot = lire_snapshot(snapshot_path)
+        if snapshot is not None:
+            save_state(watermark, len(rows), snapshot.crc)
+
         print("✅ Synchronisation réussie !")
         
     except Exception as e:
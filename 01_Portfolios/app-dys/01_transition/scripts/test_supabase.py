@@ -1,4 +1,5 @@
 from db_manager import DBManager
+from content_repository import ContentRepository
 
 def test_connection():
     print("--- Test de récupération 'A' depuis Supabase ---")
@@ -9,19 +10,20 @@ def test_connection():
         return
 
     print("\nLecture de la table 'educational_content'...")
-    data = manager.get_educational_content()
+    repo = ContentRepository(manager)
+    total = repo.count()
     
-    if not data:
+    if not total:
         print("⚠️ Aucune donnée reçue. Vérifiez que la table n'est pas vide et que 'is_active' est à TRUE.")
     else:
-        print(f"✅ {len(data)} ligne(s) trouvée(s).")
-        for item in data:
-            if item['content'] == 'A':
-                print(f"🌟 Succès ! Lettre trouvée : {item['content']} (Mot: {item['word']})")
-                print(f"   Image: {item['image_url']}")
-                print(f"   Son: {item['sound_url']}")
-            else:
-                print(f" - Autre ligne trouvée : {item['content']}")
+        print(f"✅ {total} ligne(s) active(s) dans la table.")
+        item = repo.get("letter", "A")
+        if item:
+            print(f"🌟 Succès ! Lettre trouvée : {item['content']} (Mot: {item['word']})")
+            print(f"   Image: {item['image_url']}")
+            print(f"   Son: {item['sound_url']}")
+        else:
+            print("⚠️ La lettre 'A' est absente de la table.")
 
 if __name__ == "__main__":
     test_connection()
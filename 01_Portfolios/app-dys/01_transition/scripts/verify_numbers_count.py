@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 # Ajout du chemin parent pour importer db_manager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db_manager import DBManager
+from content_repository import ContentRepository
 
 def verify_count():
     manager = DBManager()
@@ -12,13 +13,12 @@ def verify_count():
         print("❌ Erreur : Impossible d'initialiser le client Supabase.")
         return
 
-    data = manager.get_educational_content(content_type="number")
-    print(f"📊 Nombre de chiffres trouvés : {len(data)}")
+    repo = ContentRepository(manager)
+    print(f"📊 Nombre de chiffres trouvés : {repo.count('number')}")
     
-    # Tri numérique pour la vérification visuelle
-    sorted_data = sorted(data, key=lambda x: int(x['content']) if x['content'].isdigit() else 999)
-    
-    for d in sorted_data:
+    # Déjà triés numériquement par le dépôt
+    data = repo.all("number")
+    for d in data:
         print(f" - {d}")
 
     # Vérification du mélange dans main.py simulé
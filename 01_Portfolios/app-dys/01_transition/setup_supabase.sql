@@ -16,6 +16,43 @@ CREATE TABLE IF NOT EXISTS public.educational_content (
     created_at TIMESTAMPTZ DEFAULT now()             
 );
 
+-- 1 bis. Unicité (content, type) : cible des upserts groupés (scripts/seed_content.py)
+-- Supprimer les doublons éventuels avant d'appliquer la contrainte :
+-- pour chaque (content, type), seule la ligne la plus récente est conservée.
+DELETE FROM public.educational_content AS ancienne
+USING public.educational_content AS recente
+WHERE ancienne.content = recente.content
+  AND ancienne.type = recente.type
+  AND (COALESCE(ancienne.created_at, '-infinity'), ancienne.id)
+    < (COALESCE(recente.created_at, '-infinity'), recente.id);
+
+ALTER TABLE public.educational_content
+    DROP CONSTRAINT IF EXISTS educational_content_content_type_key;
+ALTER TABLE public.educational_content
+    ADD CONSTRAINT educational_content_content_type_key UNIQUE (content, type);
+
+-- 1 ter. Date de dernière modification : filigrane de la synchronisation incrémentale
+-- (scripts/sync_backup.py). Toute modification, désactivation comprise, avance updated_at.
+-- Les suppressions physiques ne sont pas visibles : préférer is_active = false.
+ALTER TABLE public.educational_content
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+CREATE OR REPLACE FUNCTION public.set_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS educational_content_set_updated_at ON public.educational_content;
+CREATE TRIGGER educational_content_set_updated_at
+    BEFORE UPDATE ON public.educational_content
+    FOR EACH ROW EXECUTE FUNCTION public.set_updated_at();
+
+CREATE INDEX IF NOT EXISTS educational_content_updated_at_idx
+    ON public.educational_content (updated_at);
+
 -- 2. Configuration des Buckets de Stockage
 INSERT INTO storage.buckets (id, name, public)
 VALUES ('images', 'images', true)
@@ -0,0 +1,80 @@
+import os
+import sys
+import json
+
+import pytest
+
+# seed_content importe db_manager (client Supabase et .env)
+pytest.importorskip("dotenv")
+pytest.importorskip("supabase")
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+from seed_content import read_definitions, upsert_rows
+
+
+def test_blank_is_active_cell_keeps_stored_value(tmp_path):
+    path = tmp_path / "contenu.csv"
+    path.write_text("content,type,word,is_active\n"
+                    "A,letter,arbre,\n"
+                    "B,letter,ballon,false\n"
+                    "C,letter,chat,1\n", encoding="utf-8")
+
+    rows = {row["content"]: row for row in read_definitions(str(path))}
+
+    # Cellule vide : non spécifié, is_active n'est pas envoyé (jamais désactivé)
+    assert "is_active" not in rows["A"]
+    assert rows["B"]["is_active"] is False
+    assert rows["C"]["is_active"] is True
+
+
+def test_json_row_without_is_active_keeps_stored_value(tmp_path):
+    path = tmp_path / "contenu.json"
+    path.write_text(json.dumps([
+        {"content": 0, "type": "number", "word": "zéro"},
+        {"content": "1", "type": "number", "word": "un", "is_active": False},
+    ]), encoding="utf-8")
+
+    rows = {row["content"]: row for row in read_definitions(str(path))}
+
+    assert "is_active" not in rows["0"]
+    assert rows["1"]["is_active"] is False
+
+
+def test_no_is_active_column_is_not_sent(tmp_path):
+    path = tmp_path / "contenu.csv"
+    path.write_text("content,type,word\nA,letter,arbre\n", encoding="utf-8")
+
+    assert read_definitions(str(path)) == [{"content": "A", "type": "letter", "word": "arbre"}]
+
+
+class _FakeClient:
+    """Client minimal : mémorise chaque lot envoyé et vérifie qu'il a des colonnes homogènes."""
+
+    def __init__(self):
+        self.batches = []
+
+    def table(self, _):
+        return self
+
+    def upsert(self, batch, on_conflict):
+        assert len({tuple(sorted(row)) for row in batch}) == 1
+        self.batches.append(batch)
+        self._last = batch
+        return self
+
+    def execute(self):
+        return type("Response", (), {"data": self._last})()
+
+
+def test_upsert_batches_group_rows_by_columns():
+    rows = [
+        {"content": "A", "type": "letter", "word": "arbre"},
+        {"content": "B", "type": "letter", "word": "ballon", "is_active": False},
+        {"content": "C", "type": "letter", "word": "chat"},
+    ]
+    client = _FakeClient()
+
+    written, failed = upsert_rows(client, rows, batch_size=100)
+
+    assert (written, failed) == (3, 0)
+    assert len(client.batches) == 2